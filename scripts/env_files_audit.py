@@ -15,148 +15,252 @@ This is intended for local hygiene reviews (not a secret scanner).
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import mmap
 import os
 import re
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, Callable, Iterable, Iterator, TextIO, cast
+
+
+# One multiline scan over the whole buffer. Every non-blank line hits exactly one
+# alternative: a comment, a KEY=value assignment, or (anything else) a parse error.
+# Blank lines never match since the junk branch needs a non-space byte.
+# Possessive quantifiers (3.11+) keep the stdlib engine from backtracking into
+# whitespace or key runs, and the value is taken verbatim to end of line (one
+# pass, no trailing-\s* retry); _classify_value strips it.
+_ASSIGN_RE = re.compile(
+    rb"^[ \t\r\f\v]*+(?:"
+    rb"(?P<comment>#)"
+    rb"|(?:export[ \t\f\v]++)?(?P<key>[A-Za-z_][A-Za-z0-9_]*+)[ \t\f\v]*+=(?P<value>[^\n]*+)"
+    rb"|(?P<junk>\S)"
+    rb")",
+    re.MULTILINE,
+)
+
+
+# Env-like filenames: .env, .env.* (.env.local, .env.production, ...) and *.env
+# (dev.env, ...). One C-level match per filename.
+_ENV_NAME_RE = re.compile(r"\.env(?:\..*)?|.*\.env", re.DOTALL)
+
+# .git-prefixed dirs are listed explicitly so pruning is a single set lookup.
+_DENY_DIRS = frozenset(
+    {
+        ".git",
+        ".github",
+        ".gitlab",
+        ".gitea",
+        "node_modules",
+        "target",
+        ".venv",
+        "dist",
+        "build",
+        ".next",
+        ".turbo",
+        "_scratch",
+        "_private",
+        "_archive",
+        "_trash",
+        "integration_test_tmp",
+    }
+)
+
+
+_SECRET_KEY_NEEDLES = (
+    "API_KEY",
+    "TOKEN",
+    "SECRET",
+    "PASSWORD",
+    "PRIVATE_KEY",
+    "ACCESS_KEY",
+    "SESSION",
+    "COOKIE",
+)
+# Single alternation scan instead of one substring search per needle.
+_SECRET_KEY_RE = re.compile("|".join(_SECRET_KEY_NEEDLES))
+# Names shorter than the shortest needle ("TOKEN") cannot match; skip the scan.
+_SECRET_KEY_MIN_LEN = min(len(n) for n in _SECRET_KEY_NEEDLES)
+
+
+# Env var names (and common placeholder/empty values) repeat heavily across files.
+@functools.lru_cache(maxsize=4096)
+def _looks_like_secret_key(k: str) -> bool:
+    return len(k) >= _SECRET_KEY_MIN_LEN and _SECRET_KEY_RE.search(k.upper()) is not None
 
 
-_ASSIGN_RE = re.compile(r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*)\s*$")
+_VALUE_CLASSES = ("empty", "placeholder", "present", "numeric", "boolish")
+_PLACEHOLDER_VALUES = frozenset({b"<SET_ME>", b"<REDACTED>", b"CHANGEME"})
+_PLACEHOLDER_SUBSTR_RE = re.compile(rb"your_|replace", re.IGNORECASE)
+_BOOLISH_VALUES = frozenset({b"0", b"1", b"true", b"false"})
 
 
-def _looks_like_secret_key(k: str) -> bool:
-    u = k.upper()
-    needles = [
-        "API_KEY",
-        "TOKEN",
-        "SECRET",
-        "PASSWORD",
-        "PRIVATE_KEY",
-        "ACCESS_KEY",
-        "SESSION",
-        "COOKIE",
-    ]
-    return any(n in u for n in needles)
-
-
-def _classify_value(raw: str) -> str:
+@functools.lru_cache(maxsize=4096)
+def _classify_value(raw: bytes) -> str:
     """
-    Classify value *without* returning it.
+    Classify value *without* returning it (or ever decoding it).
     """
     s = raw.strip()
-    if s == "":
+    if not s:
         return "empty"
     # strip quotes for classification only
-    if (len(s) >= 2) and ((s[0] == s[-1] == '"') or (s[0] == s[-1] == "'")):
+    if (len(s) >= 2) and s[:1] == s[-1:] and s[:1] in (b'"', b"'"):
         inner = s[1:-1]
     else:
         inner = s
     inner_stripped = inner.strip()
-    if inner_stripped == "":
+    if not inner_stripped:
         return "empty"
-    if inner_stripped in {"<SET_ME>", "<REDACTED>", "CHANGEME"}:
-        return "placeholder"
-    if "your_" in inner_stripped.lower() or "replace" in inner_stripped.lower():
+    # Exact-set hits first; the disjoint sets and digit check make the order safe,
+    # so the substring regex only runs on the remaining "real-looking" values.
+    if inner_stripped in _PLACEHOLDER_VALUES:
         return "placeholder"
-    if inner_stripped in {"0", "1", "true", "false"}:
+    if inner_stripped in _BOOLISH_VALUES:
         return "boolish"
     if inner_stripped.isdigit():
         return "numeric"
+    if _PLACEHOLDER_SUBSTR_RE.search(inner_stripped):
+        return "placeholder"
     return "present"
 
 
+@dataclass(frozen=True, slots=True)
+class KeyMeta:
+    likely_secret_key: bool
+    value_class: str
+
+
 @dataclass(frozen=True)
 class ParsedEnv:
+    # Unique key names in first-seen order; `assignments` also counts re-assignments.
     keys: list[str]
-    key_meta: dict[str, dict[str, Any]]
+    key_meta: dict[str, KeyMeta]
+    assignments: int
     parse_errors: int
 
 
-def parse_env_file(path: Path) -> ParsedEnv:
-    keys: list[str] = []
-    key_meta: dict[str, dict[str, Any]] = {}
+def _parse_env_buffer(buf: bytes | mmap.mmap) -> ParsedEnv:
+    key_meta: dict[str, KeyMeta] = {}
+    assignments = 0
     parse_errors = 0
 
-    try:
-        raw = path.read_text(encoding="utf-8")
-    except UnicodeDecodeError:
-        # Fall back to latin-1 best-effort; we still do not surface values.
-        raw = path.read_text(encoding="latin-1")
-
-    for line in raw.splitlines():
-        s = line.strip()
-        if not s or s.startswith("#"):
+    for m in _ASSIGN_RE.finditer(buf):
+        kind = m.lastgroup
+        if kind == "comment":
             continue
-        m = _ASSIGN_RE.match(line)
-        if not m:
+        if kind == "junk":
             parse_errors += 1
             continue
-        k = m.group(1)
-        v = m.group(2)
-        keys.append(k)
-        key_meta[k] = {
-            "likely_secret_key": _looks_like_secret_key(k),
-            "value_class": _classify_value(v),
-        }
+        # Interned: the same few names recur across files and every aggregate dict.
+        k = sys.intern(m.group("key").decode("ascii"))
+        v = m.group("value")
+        assignments += 1
+        key_meta[k] = KeyMeta(
+            likely_secret_key=_looks_like_secret_key(k),
+            value_class=_classify_value(v),
+        )
 
-    return ParsedEnv(keys=keys, key_meta=key_meta, parse_errors=parse_errors)
+    # key_meta is insertion-ordered and keeps a re-assigned key's first slot,
+    # so it doubles as the dedup set (last value wins for classification).
+    return ParsedEnv(
+        keys=list(key_meta),
+        key_meta=key_meta,
+        assignments=assignments,
+        parse_errors=parse_errors,
+    )
 
 
-def iter_env_files(root: Path, *, max_files: int) -> list[Path]:
-    # Explicit allowlist of env-like filenames (avoid grabbing random *.env assets).
-    allowed = {
-        ".env",
-        ".env.local",
-        ".env.production",
-        ".env.development",
-        ".env.test",
-        ".env.example",
-        "dev.env",
-    }
+# Above this size, map the file instead of copying it into one bytes object.
+_MMAP_MIN_BYTES = 64 * 1024
 
-    # Also allow common prefixed variants: .env.* and *.env
-    def is_env_name(name: str) -> bool:
-        if name in allowed:
-            return True
-        if name.startswith(".env."):
-            return True
-        if name.endswith(".env"):
-            return True
-        return False
-
-    deny_dirs = {
-        ".git",
-        "node_modules",
-        "target",
-        ".venv",
-        "dist",
-        "build",
-        ".next",
-        ".turbo",
-        "_scratch",
-        "_private",
-        "_archive",
-        "_trash",
-        "integration_test_tmp",
-    }
 
-    out: list[Path] = []
-    for dirpath, dirnames, filenames in os.walk(root):
-        # prune
-        dirnames[:] = [d for d in dirnames if d not in deny_dirs and not d.startswith(".git")]
-        for fn in filenames:
-            if is_env_name(fn):
-                out.append(Path(dirpath) / fn)
-                if max_files > 0 and len(out) >= max_files:
-                    break
+def parse_env_file(path: Path) -> ParsedEnv:
+    # Work on raw bytes: keys are ASCII by construction and values are only
+    # classified, so the file body never needs a full text decode.
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size > _MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _parse_env_buffer(mm)
+        raw = f.read()
+    return _parse_env_buffer(raw)
+
+
+def iter_env_files(root: Path, *, max_files: int) -> list[Path]:
+    deny_dirs = _DENY_DIRS
+    is_env_name = _ENV_NAME_RE.fullmatch
+
+    # Explicit scandir stack instead of os.walk: dirent type info avoids a stat per entry,
+    # and we only build Path objects for the (few) matches.
+    out: list[str] = []
+    stack: list[str] = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for e in it:
+                name = e.name
+                try:
+                    is_dir = e.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    # prune
+                    if name not in deny_dirs:
+                        stack.append(e.path)
+                elif is_env_name(name):
+                    # Regular files only (following links, like os.walk's filenames):
+                    # a matching symlink to a directory is neither walked nor parsed.
+                    try:
+                        if not e.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    out.append(e.path)
+                    if max_files > 0 and len(out) >= max_files:
+                        break
         if max_files > 0 and len(out) >= max_files:
             break
 
     # Stable ordering for diffs
-    out.sort(key=lambda p: str(p))
-    return out
+    out.sort()
+    return [Path(p) for p in out]
+
+
+def _dump_payload_streaming(
+    out: TextIO,
+    head: dict[str, Any],
+    files: Iterable[dict[str, Any]],
+    tail: Callable[[], dict[str, Any]],
+) -> None:
+    """
+    Byte-identical to `json.dump({**head, "files": [...], **tail()}, out, indent=2)`,
+    but writes each file report as it is produced. `tail` is called after `files`
+    is exhausted, so it may depend on aggregates built while iterating.
+    """
+
+    def enc(v: Any, depth: int) -> str:
+        # json escapes newlines inside strings, so raw "\n" only comes from indentation.
+        return json.dumps(v, indent=2).replace("\n", "\n" + "  " * depth)
+
+    out.write("{\n")
+    for k, v in head.items():
+        out.write(f"  {json.dumps(k)}: {enc(v, 1)},\n")
+    out.write('  "files": [')
+    first = True
+    for report in files:
+        out.write("\n    " if first else ",\n    ")
+        out.write(enc(report, 2))
+        first = False
+    out.write("]" if first else "\n  ]")
+    for k, v in tail().items():
+        out.write(f",\n  {json.dumps(k)}: {enc(v, 1)}")
+    out.write("\n}\n")
 
 
 def main() -> None:
@@ -180,61 +284,62 @@ def main() -> None:
     else:
         files = iter_env_files(root, max_files=max_files)
 
-    file_reports: list[dict[str, Any]] = []
-    key_to_files: dict[str, list[str]] = {}
-    likely_secret_keys: dict[str, list[str]] = {}
-    total_parse_errors = 0
-
-    for p in files:
-        parsed = parse_env_file(p)
-        total_parse_errors += parsed.parse_errors
-        rel = str(p.relative_to(root))
-
-        for k in parsed.keys:
-            key_to_files.setdefault(k, []).append(rel)
-            if parsed.key_meta.get(k, {}).get("likely_secret_key"):
-                likely_secret_keys.setdefault(k, []).append(rel)
-
-        file_reports.append(
-            {
+    key_to_files: defaultdict[str, set[str]] = defaultdict(set)
+    likely_secret_keys: defaultdict[str, list[str]] = defaultdict(list)
+
+    # Parsing is independent per file and mostly I/O; overlap it across a small
+    # pool (map keeps input order) and aggregate sequentially below.
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(files)))) as ex:
+        parsed_files = list(ex.map(parse_env_file, files))
+    total_parse_errors = sum(parsed.parse_errors for parsed in parsed_files)
+
+    # Plain prefix slicing instead of Path.relative_to per file; explicit --path
+    # entries outside the root are reported as given rather than raising.
+    root_prefix = os.path.join(str(root), "")
+
+    def iter_file_reports() -> Iterator[dict[str, Any]]:
+        # Lazily builds reports (and the cross-file aggregates) so --json can
+        # stream them without holding every report in memory.
+        for p, parsed in zip(files, parsed_files):
+            p_str = os.fspath(p)
+            rel = p_str[len(root_prefix) :] if p_str.startswith(root_prefix) else p_str
+            class_counts = Counter(m.value_class for m in parsed.key_meta.values())
+
+            for k, meta in parsed.key_meta.items():
+                key_to_files[k].add(rel)
+                if meta.likely_secret_key:
+                    likely_secret_keys[k].append(rel)
+
+            yield {
                 "path": rel,
-                "key_count": len(parsed.keys),
-                "keys": sorted(set(parsed.keys)),
+                "key_count": parsed.assignments,
+                "keys": sorted(parsed.keys),
                 "parse_errors": parsed.parse_errors,
-                "value_classes": {
-                    "empty": sum(1 for m in parsed.key_meta.values() if m["value_class"] == "empty"),
-                    "placeholder": sum(
-                        1 for m in parsed.key_meta.values() if m["value_class"] == "placeholder"
-                    ),
-                    "present": sum(
-                        1 for m in parsed.key_meta.values() if m["value_class"] == "present"
-                    ),
-                    "numeric": sum(
-                        1 for m in parsed.key_meta.values() if m["value_class"] == "numeric"
-                    ),
-                    "boolish": sum(
-                        1 for m in parsed.key_meta.values() if m["value_class"] == "boolish"
-                    ),
-                },
+                "value_classes": {c: class_counts[c] for c in _VALUE_CLASSES},
             }
-        )
-
-    duplicates = {k: v for (k, v) in key_to_files.items() if len(set(v)) >= 2}
 
-    payload = {
+    head = {
         "schema_version": 1,
         "root": str(root),
         "file_count": len(files),
         "total_parse_errors": total_parse_errors,
-        "files": file_reports,
-        "duplicates": {k: sorted(set(v)) for (k, v) in sorted(duplicates.items())},
-        "likely_secret_keys": {k: sorted(set(v)) for (k, v) in sorted(likely_secret_keys.items())},
     }
 
+    def tail() -> dict[str, Any]:
+        return {
+            "duplicates": {k: sorted(v) for (k, v) in sorted(key_to_files.items()) if len(v) >= 2},
+            "likely_secret_keys": {
+                k: sorted(set(v)) for (k, v) in sorted(likely_secret_keys.items())
+            },
+        }
+
     if args.json:
-        print(json.dumps(payload, indent=2, sort_keys=False))
+        _dump_payload_streaming(sys.stdout, head, iter_file_reports(), tail)
         return
 
+    file_reports = list(iter_file_reports())
+    payload = {**head, "files": file_reports, **tail()}
+
     files_payload = cast(list[dict[str, Any]], payload["files"])
     duplicates_payload = cast(dict[str, list[str]], payload["duplicates"])
 
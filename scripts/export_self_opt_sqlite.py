@@ -15,21 +15,60 @@ Privacy posture:
 from __future__ import annotations
 
 import argparse
-import datetime as dt
+import functools
 import hashlib
+import itertools
 import json
+import mmap
 import os
+import queue
 import re
 import sqlite3
 import subprocess
 import sys
 import tempfile
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+try:  # Optional: orjson parses several times faster; stdlib json is the fallback.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+def _stdlib_json_loads(s: Any) -> Any:
+    # Bytes are decoded as strict UTF-8 first, like read_text("utf-8"): json.loads on
+    # bytes would otherwise also sniff BOMs and UTF-16/32.
+    if not isinstance(s, str):
+        s = bytes(s).decode("utf-8")
+    return json.loads(s)
+
+
+# Parse-only fast path. Serialization stays on stdlib json so stored *_json
+# columns and report files keep their exact byte format.
+if orjson is not None:
+
+    def _json_loads(s: Any) -> Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # orjson is stricter than json (NaN/Infinity, escaped lone surrogates):
+            # retry with stdlib so what ingests doesn't depend on orjson being installed.
+            return _stdlib_json_loads(s)
+
+else:
+    _json_loads = _stdlib_json_loads
 
 
 def utc_now_iso() -> str:
-    return dt.datetime.now(dt.timezone.utc).isoformat()
+    # Same text as datetime.now(timezone.utc).isoformat(), without building datetime objects.
+    s, us = divmod(time.time_ns() // 1000, 1_000_000)
+    base = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(s))
+    return f"{base}.{us:06d}+00:00" if us else f"{base}+00:00"
 
 
 def die(msg: str) -> "NoReturn":
@@ -37,8 +76,33 @@ def die(msg: str) -> "NoReturn":
     raise SystemExit(2)
 
 
+# Parent dirs already created this run (reports usually share one directory).
+_ENSURED_DIRS: set[Path] = set()
+
+
 def ensure_parent_dir(path: Path) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+    parent = path.parent
+    if parent in _ENSURED_DIRS:
+        return
+    parent.mkdir(parents=True, exist_ok=True)
+    _ENSURED_DIRS.add(parent)
+
+
+# Artifacts above this size are parsed straight out of a read-only mapping.
+_MMAP_MIN_BYTES = 1 << 20
+
+
+def _load_json_file(path: Path) -> Any:
+    """
+    Parse a JSON file from bytes (no str decode pass). With orjson, large files are
+    parsed from an mmap'd view so the payload is never copied into a bytes object;
+    stdlib json cannot parse a buffer, so it always reads.
+    """
+    with open(path, "rb") as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= _MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as mv:
+                return _json_loads(mv)
+        return _json_loads(f.read())
 
 
 def run_chatvault_aggregate_tool_calls(
@@ -71,46 +135,93 @@ def run_chatvault_aggregate_tool_calls(
         for s in exclude_substrings:
             cmd += ["--exclude-substring", s]
 
-        # The command prints a small summary to stdout; ignore it.
-        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
-        return json.loads(out_path.read_text("utf-8"))
+        # The command prints a small summary to stdout and --verbose progress to
+        # stderr; neither is used (check=True still raises on failure), so discard both.
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return _load_json_file(out_path)
 
 
-def sql_connect(path: Path) -> sqlite3.Connection:
-    con = sqlite3.connect(str(path))
+def sql_connect(path: Path, bulk_load: bool = False, scratch: bool = False) -> sqlite3.Connection:
+    """
+    Writer connection. `bulk_load` sizes the page cache for a full rebuild (ingest
+    touches every table and index); readers keep the smaller default. `scratch` is for
+    a DB built from nothing: no fsyncs at all, since a crashed export is just rerun.
+    (No locking_mode=EXCLUSIVE or journal_mode=OFF: report builders read through their
+    own connections, which needs WAL.)
+    Not bound to the opening thread, so an ingest can hand it to a writer thread; only
+    one thread uses it at a time.
+    """
+    # Room for every distinct statement of an ingest, including one multi-row VALUES
+    # variant per chunk size from bulk_insert, so none is re-prepared after eviction.
+    con = sqlite3.connect(str(path), check_same_thread=False, cached_statements=256)
     con.row_factory = sqlite3.Row
     con.execute("PRAGMA journal_mode=WAL;")
-    con.execute("PRAGMA synchronous=NORMAL;")
+    if scratch:
+        con.execute("PRAGMA synchronous=OFF;")
+    else:
+        con.execute("PRAGMA synchronous=NORMAL;")
+    con.execute("PRAGMA temp_store=MEMORY;")
+    if bulk_load:
+        con.execute("PRAGMA cache_size=-262144;")  # 256 MiB page cache
+    else:
+        con.execute("PRAGMA cache_size=-65536;")  # 64 MiB page cache
+    con.execute("PRAGMA mmap_size=268435456;")  # read up to 256 MiB of the DB via mmap
     con.execute("PRAGMA foreign_keys=ON;")
     return con
 
 
-ISSUE_VOCAB: tuple[str, ...] = (
-    "missing_key_facts",
-    "too_short",
-    "boilerplate",
-    "low_signal",
-    "off_topic",
-    "truncated",
-    "did_not_hit_expected_url",
+def sql_connect_ro(path: Path) -> sqlite3.Connection:
+    """
+    Read-only connection for report builders; one per thread (connections are not
+    shared across threads). WAL lets these read alongside the writer's connection.
+    """
+    con = sqlite3.connect(path.resolve().as_uri() + "?mode=ro", uri=True)
+    con.row_factory = sqlite3.Row
+    con.execute("PRAGMA query_only=1;")
+    con.execute("PRAGMA temp_store=MEMORY;")
+    con.execute("PRAGMA cache_size=-65536;")
+    con.execute("PRAGMA mmap_size=268435456;")
+    return con
+
+
+ISSUE_VOCAB: frozenset[str] = frozenset(
+    {
+        "missing_key_facts",
+        "too_short",
+        "boilerplate",
+        "low_signal",
+        "off_topic",
+        "truncated",
+        "did_not_hit_expected_url",
+    }
 )
 
-CRITIC_ISSUE_VOCAB: tuple[str, ...] = (
-    "missing_structured_content",
-    "missing_or_bad_kind",
-    "unexpected_kind",
-    "tool_failed",
-    "missing_urls",
-    "empty_top_chunks",
-    "low_signal",
-    "warnings_present",
-    "missing_markdown",
-    "markdown_is_json",
-    "markdown_missing_request_section",
-    "markdown_missing_summary_section",
+CRITIC_ISSUE_VOCAB: frozenset[str] = frozenset(
+    {
+        "missing_structured_content",
+        "missing_or_bad_kind",
+        "unexpected_kind",
+        "tool_failed",
+        "missing_urls",
+        "empty_top_chunks",
+        "low_signal",
+        "warnings_present",
+        "missing_markdown",
+        "markdown_is_json",
+        "markdown_missing_request_section",
+        "markdown_missing_summary_section",
+    }
 )
 
 
+def _is_canonical_issue_list(xs: list[str], vocab: frozenset[str]) -> bool:
+    """
+    True when normalization would be the identity: every entry is already an exact
+    vocabulary term and there are no duplicates (so norm == xs, unknown == 0).
+    """
+    return all(x in vocab for x in xs) and len(set(xs)) == len(xs)
+
+
 def normalize_critic_issue_vocab(s: str) -> Optional[str]:
     """
     Critic issues should already be controlled vocabulary; keep mapping strict.
@@ -128,9 +239,11 @@ def normalize_critic_issue_vocab(s: str) -> Optional[str]:
 
 
 def normalize_critic_issue_list(xs: Any) -> tuple[Optional[str], Optional[str], int]:
-    if not (isinstance(xs, list) and all(isinstance(x, str) for x in xs)):
+    raw_json = json_str_list(xs)
+    if raw_json is None:
         return None, None, 0
-    raw_json = json.dumps(xs, sort_keys=True)
+    if _is_canonical_issue_list(xs, CRITIC_ISSUE_VOCAB):
+        return raw_json, raw_json, 0
     norm: list[str] = []
     unknown = 0
     for s in xs:
@@ -140,10 +253,32 @@ def normalize_critic_issue_list(xs: Any) -> tuple[Optional[str], Optional[str],
             continue
         if n not in norm:
             norm.append(n)
-    norm_json = json.dumps(norm, sort_keys=True)
+    norm_json = json.dumps(norm)
     return raw_json, norm_json, unknown
 
 
+# Free-form judge phrasing -> controlled vocabulary. One compiled alternation per
+# label; checked in order so more specific signals win. Inputs are already
+# lowercased with "_"/"-" folded to spaces.
+_ISSUE_VOCAB_RULES: tuple[tuple[re.Pattern[str], str], ...] = (
+    (re.compile(r"expected url|did not hit expected|reach the expected"), "did_not_hit_expected_url"),
+    (re.compile(r"trunc|invalid json|unfinished|incomplete"), "truncated"),
+    (re.compile(r"off topic|unrelated"), "off_topic"),
+    (re.compile(r"low signal|gunk"), "low_signal"),
+    (re.compile(r"boilerplate|nav|toc|app shell"), "boilerplate"),
+    (re.compile(r"too short|brevity"), "too_short"),
+    (
+        re.compile(
+            r"missing key"
+            r"|missing.*(?:facts|results|explanations)"
+            r"|(?:facts|results|explanations).*missing",
+            re.DOTALL,
+        ),
+        "missing_key_facts",
+    ),
+)
+
+
 def normalize_issue_vocab(s: str) -> Optional[str]:
     """
     Map older/free-form judge strings into our controlled vocabulary.
@@ -155,21 +290,10 @@ def normalize_issue_vocab(s: str) -> Optional[str]:
     # Normalize separators.
     t = t.replace("_", " ").replace("-", " ")
 
-    # Prefer specific signals first.
-    if "expected url" in t or "did not hit expected" in t or "reach the expected" in t:
-        return "did_not_hit_expected_url"
-    if "trunc" in t or "invalid json" in t or "unfinished" in t or "incomplete" in t:
-        return "truncated"
-    if "off topic" in t or "unrelated" in t:
-        return "off_topic"
-    if "low signal" in t or "low-signal" in t or "gunk" in t:
-        return "low_signal"
-    if "boilerplate" in t or "nav" in t or "toc" in t or "app shell" in t:
-        return "boilerplate"
-    if "too short" in t or "brevity" in t:
-        return "too_short"
-    if "missing key" in t or ("missing" in t and ("facts" in t or "results" in t or "explanations" in t)):
-        return "missing_key_facts"
+    # Prefer specific signals first (rule order is priority order).
+    for pat, label in _ISSUE_VOCAB_RULES:
+        if pat.search(t):
+            return label
 
     # Exact-match fallback for already-normalized strings.
     k = t.replace(" ", "_")
@@ -182,9 +306,12 @@ def normalize_issue_list(xs: Any) -> tuple[Optional[str], Optional[str], int]:
     """
     Returns (raw_json, norm_json, unknown_count).
     """
-    if not (isinstance(xs, list) and all(isinstance(x, str) for x in xs)):
+    raw_json = json_str_list(xs)
+    if raw_json is None:
         return None, None, 0
-    raw_json = json.dumps(xs, sort_keys=True)
+    # Every vocabulary term normalizes to itself, so canonical input skips the rules.
+    if _is_canonical_issue_list(xs, ISSUE_VOCAB):
+        return raw_json, raw_json, 0
     norm: list[str] = []
     unknown = 0
     for s in xs:
@@ -194,89 +321,161 @@ def normalize_issue_list(xs: Any) -> tuple[Optional[str], Optional[str], int]:
             continue
         if n not in norm:
             norm.append(n)
-    norm_json = json.dumps(norm, sort_keys=True)
+    norm_json = json.dumps(norm)
     return raw_json, norm_json, unknown
 
 
-def _json_load_list(s: Optional[str]) -> list[Any]:
-    if not isinstance(s, str) or not s.strip():
-        return []
-    try:
-        v = json.loads(s)
-    except Exception:
-        return []
-    return v if isinstance(v, list) else []
+# Exactly the characters str.strip() removes (every c with c.isspace()), for
+# SQLite trim(x, chars), whose default only strips spaces.
+_PY_WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
 
 
-def emit_vlm_report(con: sqlite3.Connection, out_path: Path, top_k_fixes: int = 10) -> None:
+def _events_where(stage: str, src_path_substring: Optional[str]) -> tuple[str, tuple[Any, ...]]:
+    """
+    WHERE clause + params for report scans over webpipe_transcript_events.
+    `stage` leads so idx_webpipe_transcript_events_stage_src can seek it; the
+    src_path substring test then runs on the index entry (covering), not the row.
     """
-    Write a small, actionable report from ingested VLM runs.
+    where = "stage=?"
+    params: tuple[Any, ...] = (stage,)
+    if isinstance(src_path_substring, str) and src_path_substring.strip():
+        where += " and instr(src_path, ?) > 0"
+        params += (src_path_substring.strip(),)
+    return where, params
+
+
+# JSONB (binary JSON) needs SQLite 3.45+; older libraries store minified JSON text.
+# json_extract() and the ->/->> operators read either form.
+_REPORT_PAYLOAD_SQL = "jsonb(?)" if sqlite3.sqlite_version_info >= (3, 45, 0) else "json(?)"
+
+
+def write_report(con: sqlite3.Connection, out_path: Path, payload: Dict[str, Any]) -> None:
+    """
+    Write a report as indented JSON for humans, and keep a copy in the `reports`
+    table (keyed by kind) so downstream tooling can query it without re-parsing files.
+    """
+    con.execute(
+        f"""
+        INSERT INTO reports(kind, generated_at_utc, payload) VALUES (?, ?, {_REPORT_PAYLOAD_SQL})
+        ON CONFLICT(kind) DO UPDATE SET
+          generated_at_utc=excluded.generated_at_utc,
+          payload=excluded.payload
+        """,
+        (payload["kind"], payload["generated_at_utc"], json.dumps(payload, separators=(",", ":"))),
+    )
+    ensure_parent_dir(out_path)
+    # json.dump streams encoder chunks to the file (no full indented string in memory);
+    # the rename means readers never see a partially written report.
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, out_path)
+
+
+def build_vlm_report(con: sqlite3.Connection, top_k_fixes: int = 10) -> Dict[str, Any]:
+    """
+    Build a small, actionable report from ingested VLM runs.
     Output is JSON (privacy-safe: no raw page text, only counts + fix strings).
     """
     cur = con.cursor()
     total_runs = cur.execute("select count(*) from webpipe_eval_vlm_runs").fetchone()[0]
     total_inputs = cur.execute("select count(*) from webpipe_eval_vlm_per_input").fetchone()[0]
 
+    # Aggregate in SQLite: json_each() unnests each run's goal profiles (and each
+    # input's consensus fixes), so only one row per profile / fix crosses into Python.
+    # Mirrors the old per-row loop: missing/invalid/empty profile lists fall back to
+    # "<no_goal_profile>", non-string or blank entries are skipped, and values are
+    # trimmed with Python's str.strip() whitespace set.
+    prof_cte = """
+        with prof as (
+          select r.run_key, trim(gp.value, :ws) as profile, r.model, r.temperature,
+                 i.score_0_10, i.p0_count, i.p1_count, i.p2_count, i.consensus_fixes_json
+          from webpipe_eval_vlm_runs r
+          join webpipe_eval_vlm_per_input i on i.run_key = r.run_key,
+          json_each(
+            case when json_valid(r.goal_profiles_json)
+                      and json_type(r.goal_profiles_json) = 'array'
+                      and json_array_length(r.goal_profiles_json) > 0
+                 then r.goal_profiles_json else '["<no_goal_profile>"]' end
+          ) gp
+          where gp.type = 'text' and trim(gp.value, :ws) <> ''
+        )
+    """
+    params = {"ws": _PY_WHITESPACE, "top_k": max(0, top_k_fixes)}
+
     by_profile: Dict[str, Dict[str, Any]] = {}
-    for r in cur.execute(
-        """
-        select r.run_key, r.goal_profiles_json, r.model, r.temperature,
-               i.score_0_10, i.p0_count, i.p1_count, i.p2_count,
-               i.consensus_fixes_json
-        from webpipe_eval_vlm_runs r
-        join webpipe_eval_vlm_per_input i on i.run_key = r.run_key
-        """
+    for prof, runs_n, inputs_n, sum_score, score_n, p0, p1, p2 in cur.execute(
+        prof_cte
+        + """
+        select profile, count(distinct run_key), count(*),
+               total(score_0_10), count(score_0_10),
+               coalesce(sum(p0_count), 0), coalesce(sum(p1_count), 0), coalesce(sum(p2_count), 0)
+        from prof group by profile
+        """,
+        params,
     ):
-        run_key, gp_json, model, temp, score, p0, p1, p2, fixes_json = r
-        profiles = _json_load_list(gp_json) or ["<no_goal_profile>"]
-        fixes = [x for x in _json_load_list(fixes_json) if isinstance(x, str)]
-        for prof in profiles:
-            if not isinstance(prof, str) or not prof.strip():
-                continue
-            k = prof.strip()
-            b = by_profile.setdefault(
-                k,
-                {
-                    "runs": set(),
-                    "inputs": 0,
-                    "sum_score": 0.0,
-                    "score_n": 0,
-                    "p0": 0,
-                    "p1": 0,
-                    "p2": 0,
-                    "fix_counts": {},
-                    "models": {},
-                },
-            )
-            b["runs"].add(run_key)
-            b["inputs"] += 1
-            if isinstance(score, (int, float)):
-                b["sum_score"] += float(score)
-                b["score_n"] += 1
-            b["p0"] += int(p0 or 0)
-            b["p1"] += int(p1 or 0)
-            b["p2"] += int(p2 or 0)
-            for f in fixes:
-                ff = f.strip()
-                if not ff:
-                    continue
-                b["fix_counts"][ff] = b["fix_counts"].get(ff, 0) + 1
-            mk = f"{model or '<unknown_model>'}@{temp if temp is not None else 'na'}"
-            b["models"][mk] = b["models"].get(mk, 0) + 1
+        by_profile[prof] = {
+            "runs": int(runs_n),
+            "inputs": int(inputs_n),
+            "sum_score": float(sum_score),
+            "score_n": int(score_n),
+            "p0": int(p0),
+            "p1": int(p1),
+            "p2": int(p2),
+            "fix_counts": {},
+            "models": Counter(),
+        }
+
+    # model/temperature are grouped raw; the display key is formatted in Python
+    # (several raw pairs can share one key, e.g. NULL and "" models).
+    for prof, model, temp, n in cur.execute(
+        prof_cte + "select profile, model, temperature, count(*) from prof group by 1, 2, 3",
+        params,
+    ):
+        mk = f"{model or '<unknown_model>'}@{temp if temp is not None else 'na'}"
+        by_profile[prof]["models"][mk] += int(n)
+
+    # Top-k fixes per profile, ranked and limited in SQL (count desc, then fix).
+    for prof, fix, n in cur.execute(
+        prof_cte
+        + """
+        , fixes as (
+          select profile, trim(cf.value, :ws) as fix, count(*) as n
+          from prof,
+          json_each(
+            case when json_valid(consensus_fixes_json) and json_type(consensus_fixes_json) = 'array'
+                 then consensus_fixes_json else '[]' end
+          ) cf
+          where cf.type = 'text' and trim(cf.value, :ws) <> ''
+          group by 1, 2
+        )
+        select profile, fix, n from (
+          select profile, fix, n,
+                 row_number() over (partition by profile order by n desc, fix) as rn
+          from fixes
+        )
+        where rn <= :top_k
+        """,
+        params,
+    ):
+        by_profile[prof]["fix_counts"][fix] = int(n)
 
     # Finalize: make JSON-friendly + compute averages and top fixes.
     prof_rows: list[Dict[str, Any]] = []
     for prof, b in by_profile.items():
-        runs_n = len(b["runs"])
+        runs_n = int(b["runs"])
         inputs_n = int(b["inputs"])
         score_avg = None
         if b["score_n"] > 0:
             score_avg = b["sum_score"] / float(b["score_n"])
-        fix_counts = [(k, v) for k, v in b["fix_counts"].items()]
-        fix_counts.sort(key=lambda kv: (-kv[1], kv[0]))
+        fix_counts = sorted(b["fix_counts"].items(), key=lambda kv: (-kv[1], kv[0]))
         top_fixes = [{"fix": k, "count": v} for k, v in fix_counts[: max(0, top_k_fixes)]]
-        models = [(k, v) for k, v in b["models"].items()]
-        models.sort(key=lambda kv: (-kv[1], kv[0]))
+        models = sorted(b["models"].items(), key=lambda kv: (-kv[1], kv[0]))
         prof_rows.append(
             {
                 "goal_profile": prof,
@@ -313,53 +512,66 @@ def emit_vlm_report(con: sqlite3.Connection, out_path: Path, top_k_fixes: int =
         "totals": {"vlm_runs": int(total_runs), "vlm_inputs": int(total_inputs)},
         "by_goal_profile": prof_rows,
     }
-    ensure_parent_dir(out_path)
-    out_path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return payload
+
+
+def _top_json_array_counts(
+    cur: sqlite3.Cursor,
+    column: str,
+    where: str,
+    params: tuple[Any, ...],
+    top_k: int,
+) -> list[tuple[str, int]]:
+    """
+    Count (stripped, non-blank) string entries of a JSON-array column across the
+    matching events; returns the top_k as (value, count), count desc then value.
+    Unnesting, counting and ranking all run inside SQLite via json_each().
+    """
+    sql = f"""
+        select k, count(*) as n from (
+          select trim(je.value, ?) as k
+          from webpipe_transcript_events,
+          json_each(
+            case when json_valid({column}) and json_type({column}) = 'array'
+                 then {column} else '[]' end
+          ) je
+          where {where} and je.type = 'text'
+        )
+        where k <> ''
+        group by k
+        order by n desc, k
+        limit ?
+    """
+    rows = cur.execute(sql, (_PY_WHITESPACE, *params, max(0, int(top_k))))
+    return [(k, int(n)) for (k, n) in rows]
 
 
-def emit_critic_report(
+def build_critic_report(
     con: sqlite3.Connection,
-    out_path: Path,
     top_k: int = 20,
     src_path_substring: Optional[str] = None,
-) -> None:
+) -> Dict[str, Any]:
     """
-    Write a small, actionable report from ingested critic transcript events.
+    Build a small, actionable report from ingested critic transcript events.
     Output is JSON (privacy-safe: no raw page text, only issue counts + boolean rates).
     """
     cur = con.cursor()
-    where = "stage='critic'"
-    params: tuple[Any, ...] = ()
-    if isinstance(src_path_substring, str) and src_path_substring.strip():
-        where += " and instr(src_path, ?) > 0"
-        params = (src_path_substring.strip(),)
+    where, params = _events_where("critic", src_path_substring)
 
-    total = cur.execute(f"select count(*) from webpipe_transcript_events where {where}", params).fetchone()[0]
-    ok_md = cur.execute(
-        f"select count(*) from webpipe_transcript_events where {where} and critic_markdown_ok=1",
-        params,
-    ).fetchone()[0]
-    ok_struct = cur.execute(
-        f"select count(*) from webpipe_transcript_events where {where} and critic_structured_ok=1",
+    # All totals in one scan (instead of one count(*) query per total).
+    total, ok_md, ok_struct, unknown_total = cur.execute(
+        f"""
+        select count(*),
+               coalesce(sum(critic_markdown_ok=1), 0),
+               coalesce(sum(critic_structured_ok=1), 0),
+               coalesce(sum(critic_issues_unknown_count), 0)
+        from webpipe_transcript_events where {where}
+        """,
         params,
-    ).fetchone()[0]
+    ).fetchone()
 
     # Expand critic_issues_norm_json arrays into counts.
-    counts: Dict[str, int] = {}
-    unknown_total = 0
-    for (norm_json, unk) in cur.execute(
-        f"select critic_issues_norm_json, critic_issues_unknown_count from webpipe_transcript_events where {where}",
-        params,
-    ):
-        unknown_total += int(unk or 0)
-        issues = _json_load_list(norm_json) if isinstance(norm_json, str) else []
-        for it in issues:
-            if not isinstance(it, str) or not it.strip():
-                continue
-            k = it.strip()
-            counts[k] = counts.get(k, 0) + 1
-
-    top = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))[: int(top_k)]
+    top = _top_json_array_counts(cur, "critic_issues_norm_json", where, params, top_k)
     payload = {
         "schema_version": 1,
         "kind": "webpipe_self_opt_critic_report",
@@ -372,53 +584,32 @@ def emit_critic_report(
         },
         "top_issue_counts": [{"issue": k, "count": int(v)} for (k, v) in top],
     }
-    ensure_parent_dir(out_path)
-    out_path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return payload
 
 
-def emit_judge_musings_report(
+def build_judge_musings_report(
     con: sqlite3.Connection,
-    out_path: Path,
     top_k: int = 20,
     src_path_substring: Optional[str] = None,
-) -> None:
+) -> Dict[str, Any]:
     """
-    Write a small, actionable report from ingested judge musings (dimensions only).
+    Build a small, actionable report from ingested judge musings (dimensions only).
     Output is JSON (privacy-safe: dimensions + counts only).
     """
     cur = con.cursor()
-    where = "stage='judge'"
-    params: tuple[Any, ...] = ()
-    if isinstance(src_path_substring, str) and src_path_substring.strip():
-        where += " and instr(src_path, ?) > 0"
-        params = (src_path_substring.strip(),)
-
-    total_judge_events = cur.execute(
-        f"select count(*) from webpipe_transcript_events where {where}",
-        params,
-    ).fetchone()[0]
-    total_with_musings = cur.execute(
-        f"select count(*) from webpipe_transcript_events where {where} and judge_musing_dimensions_json is not null",
-        params,
-    ).fetchone()[0]
-    unknown_total = cur.execute(
-        f"select coalesce(sum(judge_musing_dimensions_unknown_count),0) from webpipe_transcript_events where {where}",
-        params,
-    ).fetchone()[0]
+    where, params = _events_where("judge", src_path_substring)
 
-    counts: Dict[str, int] = {}
-    for (dims_json,) in cur.execute(
-        f"select judge_musing_dimensions_json from webpipe_transcript_events where {where} and judge_musing_dimensions_json is not null",
+    total_judge_events, total_with_musings, unknown_total = cur.execute(
+        f"""
+        select count(*),
+               count(judge_musing_dimensions_json),
+               coalesce(sum(judge_musing_dimensions_unknown_count), 0)
+        from webpipe_transcript_events where {where}
+        """,
         params,
-    ):
-        dims = _json_load_list(dims_json) if isinstance(dims_json, str) else []
-        for d in dims:
-            if not isinstance(d, str) or not d.strip():
-                continue
-            k = d.strip()
-            counts[k] = counts.get(k, 0) + 1
+    ).fetchone()
 
-    top = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))[: int(top_k)]
+    top = _top_json_array_counts(cur, "judge_musing_dimensions_json", where, params, top_k)
     payload = {
         "schema_version": 1,
         "kind": "webpipe_self_opt_judge_musings_report",
@@ -430,83 +621,72 @@ def emit_judge_musings_report(
         },
         "top_dimension_counts": [{"dimension": k, "count": int(v)} for (k, v) in top],
     }
-    ensure_parent_dir(out_path)
-    out_path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return payload
 
 
-def emit_judge_context_report(
+def build_judge_context_report(
     con: sqlite3.Connection,
-    out_path: Path,
     src_path_substring: Optional[str] = None,
-) -> None:
+) -> Dict[str, Any]:
     """
     Report whether judges had enough context (counts + basic distributions).
     Output is JSON (privacy-safe).
     """
     cur = con.cursor()
 
-    where = "stage='judge'"
-    params: tuple[Any, ...] = ()
-    if isinstance(src_path_substring, str) and src_path_substring.strip():
-        where += " and instr(src_path, ?) > 0"
-        params = (src_path_substring.strip(),)
+    where, params = _events_where("judge", src_path_substring)
 
-    total = cur.execute(f"select count(*) from webpipe_transcript_events where {where}", params).fetchone()[0]
-    has_ctx = cur.execute(
-        f"select count(*) from webpipe_transcript_events where {where} and judge_ctx_evidence_chars is not null",
-        params,
-    ).fetchone()[0]
-    truncated = cur.execute(
-        f"select count(*) from webpipe_transcript_events where {where} and judge_ctx_evidence_truncated=1",
-        params,
-    ).fetchone()[0]
-    low_urls = cur.execute(
-        f"select count(*) from webpipe_transcript_events where {where} and judge_ctx_observed_url_count is not null and judge_ctx_observed_url_count<=0",
-        params,
-    ).fetchone()[0]
-    low_evidence = cur.execute(
-        f"select count(*) from webpipe_transcript_events where {where} and judge_ctx_evidence_chars is not null and judge_ctx_evidence_chars<400",
+    # Totals and evidence-size buckets in one scan; SQLite does the bucketing.
+    # (NULL comparisons are NULL, which sum() skips, so no explicit not-null guards.)
+    (total, has_ctx, truncated, low_urls, b_lt400, b_lt800, b_lt1500, b_ge1500) = cur.execute(
+        f"""
+        select count(*),
+               count(judge_ctx_evidence_chars),
+               coalesce(sum(judge_ctx_evidence_truncated=1), 0),
+               coalesce(sum(judge_ctx_observed_url_count<=0), 0),
+               coalesce(sum(judge_ctx_evidence_chars<400), 0),
+               coalesce(sum(judge_ctx_evidence_chars>=400 and judge_ctx_evidence_chars<800), 0),
+               coalesce(sum(judge_ctx_evidence_chars>=800 and judge_ctx_evidence_chars<1500), 0),
+               coalesce(sum(judge_ctx_evidence_chars>=1500), 0)
+        from webpipe_transcript_events where {where}
+        """,
         params,
-    ).fetchone()[0]
+    ).fetchone()
+    low_evidence = b_lt400
 
     # Bucket evidence sizes for quick visibility.
-    buckets = {"<400": 0, "400-799": 0, "800-1499": 0, "1500+": 0}
-    for (n,) in cur.execute(
-        f"select judge_ctx_evidence_chars from webpipe_transcript_events where {where} and judge_ctx_evidence_chars is not null",
-        params,
-    ):
-        if not isinstance(n, int):
-            continue
-        if n < 400:
-            buckets["<400"] += 1
-        elif n < 800:
-            buckets["400-799"] += 1
-        elif n < 1500:
-            buckets["800-1499"] += 1
-        else:
-            buckets["1500+"] += 1
+    buckets = {
+        "<400": int(b_lt400),
+        "400-799": int(b_lt800),
+        "800-1499": int(b_lt1500),
+        "1500+": int(b_ge1500),
+    }
 
     # Worst cases by evidence_chars (smallest) and by score (lowest), limited to 10.
-    smallest = cur.execute(
-        f"""
-        select call_id, llm_overall_score, judge_ctx_observed_url_count, judge_ctx_warnings_count, judge_ctx_evidence_chars, judge_ctx_evidence_truncated
-        from webpipe_transcript_events
-        where {where} and judge_ctx_evidence_chars is not null
-        order by judge_ctx_evidence_chars asc
-        limit 10
-        """,
-        params,
-    ).fetchall()
-    lowest_score = cur.execute(
+    # One scan ranks every event both ways; rows then go to whichever list(s) they rank in.
+    smallest: list[tuple[int, tuple[Any, ...]]] = []
+    lowest_score: list[tuple[int, tuple[Any, ...]]] = []
+    for row in con.execute(
         f"""
-        select call_id, llm_overall_score, judge_ctx_observed_url_count, judge_ctx_warnings_count, judge_ctx_evidence_chars, judge_ctx_evidence_truncated
-        from webpipe_transcript_events
-        where {where} and llm_overall_score is not null
-        order by llm_overall_score asc
-        limit 10
+        select * from (
+          select call_id, llm_overall_score, judge_ctx_observed_url_count, judge_ctx_warnings_count, judge_ctx_evidence_chars, judge_ctx_evidence_truncated,
+                 row_number() over (order by judge_ctx_evidence_chars asc nulls last) as rn_ev,
+                 row_number() over (order by llm_overall_score asc nulls last) as rn_sc
+          from webpipe_transcript_events
+          where {where}
+        )
+        where (rn_ev <= 10 and judge_ctx_evidence_chars is not null)
+           or (rn_sc <= 10 and llm_overall_score is not null)
         """,
         params,
-    ).fetchall()
+    ):
+        r, rn_ev, rn_sc = tuple(row[:6]), row[6], row[7]
+        if rn_ev <= 10 and r[4] is not None:
+            smallest.append((rn_ev, r))
+        if rn_sc <= 10 and r[1] is not None:
+            lowest_score.append((rn_sc, r))
+    smallest.sort()
+    lowest_score.sort()
 
     def row_to_obj(r):
         (call_id, score, urls, warns, ev_chars, ev_tr) = r
@@ -531,11 +711,10 @@ def emit_judge_context_report(
             "evidence_chars_lt_400": int(low_evidence),
         },
         "evidence_chars_buckets": buckets,
-        "worst_by_evidence_chars": [row_to_obj(r) for r in smallest],
-        "worst_by_score": [row_to_obj(r) for r in lowest_score],
+        "worst_by_evidence_chars": [row_to_obj(r) for _, r in smallest],
+        "worst_by_score": [row_to_obj(r) for _, r in lowest_score],
     }
-    ensure_parent_dir(out_path)
-    out_path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return payload
 
 
 def sql_init(con: sqlite3.Connection) -> None:
@@ -564,7 +743,9 @@ def sql_init(con: sqlite3.Connection) -> None:
         CREATE TABLE IF NOT EXISTS webpipe_transcript_files (
           path TEXT PRIMARY KEY,
           mtime_epoch_s INTEGER,
-          bytes INTEGER
+          bytes INTEGER,
+          -- byte offset just past the last complete line read (resume point for --incremental)
+          last_offset INTEGER
         );
 
         CREATE TABLE IF NOT EXISTS webpipe_transcript_events (
@@ -656,11 +837,6 @@ def sql_init(con: sqlite3.Connection) -> None:
           FOREIGN KEY (src_path) REFERENCES webpipe_transcript_files(path)
         );
 
-        CREATE INDEX IF NOT EXISTS idx_webpipe_transcript_events_stage
-          ON webpipe_transcript_events(run_kind, stage);
-        CREATE INDEX IF NOT EXISTS idx_webpipe_transcript_events_tool
-          ON webpipe_transcript_events(tool_name);
-
         -- webpipe eval artifacts (judge swarm, search/fetch/search-extract)
         CREATE TABLE IF NOT EXISTS webpipe_eval_artifact_files (
           path TEXT PRIMARY KEY,
@@ -668,7 +844,8 @@ def sql_init(con: sqlite3.Connection) -> None:
           schema_version INTEGER,
           generated_at_epoch_s INTEGER,
           mtime_epoch_s INTEGER,
-          bytes INTEGER
+          bytes INTEGER,
+          ingest_version INTEGER -- _EVAL_ARTIFACT_INGEST_VERSION that wrote this row
         );
 
         CREATE TABLE IF NOT EXISTS webpipe_eval_judge_swarm_runs (
@@ -743,11 +920,6 @@ def sql_init(con: sqlite3.Connection) -> None:
           FOREIGN KEY (run_key) REFERENCES webpipe_eval_judge_swarm_runs(run_key)
         );
 
-        CREATE INDEX IF NOT EXISTS idx_webpipe_eval_judge_trials_score
-          ON webpipe_eval_judge_trials(judge_overall_score);
-        CREATE INDEX IF NOT EXISTS idx_webpipe_eval_judge_trials_cfg
-          ON webpipe_eval_judge_trials(agentic, agentic_selector, url_selection_mode, fetch_backend);
-
         -- VLM eval summaries (eval-vlm-run)
         CREATE TABLE IF NOT EXISTS webpipe_eval_vlm_runs (
           run_key TEXT PRIMARY KEY,
@@ -783,6 +955,61 @@ def sql_init(con: sqlite3.Connection) -> None:
           top_3_fixes_json TEXT,
           FOREIGN KEY (run_key) REFERENCES webpipe_eval_vlm_runs(run_key)
         );
+
+        -- Emitted reports (same payload as the --*-report-out files)
+        CREATE TABLE IF NOT EXISTS reports (
+          kind TEXT PRIMARY KEY,
+          generated_at_utc TEXT NOT NULL,
+          payload BLOB NOT NULL
+        );
+        """
+    )
+    # Databases written before --incremental existed lack the resume column.
+    cols = {r[1] for r in con.execute("PRAGMA table_info(webpipe_transcript_files)")}
+    if "last_offset" not in cols:
+        con.execute("ALTER TABLE webpipe_transcript_files ADD COLUMN last_offset INTEGER")
+    cols = {r[1] for r in con.execute("PRAGMA table_info(webpipe_eval_artifact_files)")}
+    if "ingest_version" not in cols:
+        con.execute("ALTER TABLE webpipe_eval_artifact_files ADD COLUMN ingest_version INTEGER")
+
+
+# Apart from the transcript and judge-swarm tables (which ingest updates per file),
+# everything is small and re-derived on each run; --incremental clears these
+# (children before parents) and re-ingests them.
+_REBUILT_TABLES: tuple[str, ...] = (
+    "cursor_tool_counts",
+    "webpipe_eval_vlm_per_input",
+    "webpipe_eval_vlm_runs",
+    "reports",
+)
+
+
+def sql_reset_rebuilt_tables(con: sqlite3.Connection) -> None:
+    for table in _REBUILT_TABLES:
+        con.execute(f"DELETE FROM {table}")
+    # VLM run summaries are re-ingested in full; their file records go with them.
+    con.execute("DELETE FROM webpipe_eval_artifact_files WHERE kind='webpipe_eval_vlm_run'")
+
+
+def sql_init_indexes(con: sqlite3.Connection) -> None:
+    """
+    Secondary indexes, created after ingest so bulk inserts don't maintain them
+    row by row; ANALYZE then gives the planner stats for the report queries.
+    """
+    con.executescript(
+        """
+        CREATE INDEX IF NOT EXISTS idx_webpipe_transcript_events_stage
+          ON webpipe_transcript_events(run_kind, stage);
+        CREATE INDEX IF NOT EXISTS idx_webpipe_transcript_events_tool
+          ON webpipe_transcript_events(tool_name);
+        CREATE INDEX IF NOT EXISTS idx_webpipe_transcript_events_stage_src
+          ON webpipe_transcript_events(stage, src_path);
+        CREATE INDEX IF NOT EXISTS idx_webpipe_eval_judge_trials_score
+          ON webpipe_eval_judge_trials(judge_overall_score);
+        CREATE INDEX IF NOT EXISTS idx_webpipe_eval_judge_trials_cfg
+          ON webpipe_eval_judge_trials(agentic, agentic_selector, url_selection_mode, fetch_backend);
+
+        ANALYZE;
         """
     )
 
@@ -820,46 +1047,26 @@ def ingest_cursor_tool_counts(
     if not isinstance(top_tools, list):
         return
 
-    for t in top_tools:
-        if not isinstance(t, dict):
-            continue
-        name = t.get("name")
-        count = t.get("count")
-        if not isinstance(name, str) or not isinstance(count, int):
-            continue
+    def iter_rows() -> Iterator[tuple[Any, ...]]:
+        for t in top_tools:
+            if not isinstance(t, dict):
+                continue
+            name = t.get("name")
+            count = t.get("count")
+            if not isinstance(name, str) or not isinstance(count, int):
+                continue
 
-        fs = t.get("first_seen") if isinstance(t.get("first_seen"), dict) else {}
-        ls = t.get("last_seen") if isinstance(t.get("last_seen"), dict) else {}
-
-        first_rowid = fs.get("rowid") if isinstance(fs.get("rowid"), int) else None
-        last_rowid = ls.get("rowid") if isinstance(ls.get("rowid"), int) else None
-        first_trace_id = fs.get("trace_id") if isinstance(fs.get("trace_id"), str) else None
-        last_trace_id = ls.get("trace_id") if isinstance(ls.get("trace_id"), str) else None
-        first_blob_prefix = blob_prefix_from_id_meta(fs.get("id_meta"))
-        last_blob_prefix = blob_prefix_from_id_meta(ls.get("id_meta"))
-
-        con.execute(
-            """
-            INSERT INTO cursor_tool_counts(
-              name, count, first_rowid, last_rowid,
-              first_trace_id, last_trace_id,
-              first_blob_prefix_hex, last_blob_prefix_hex,
-              source_db_path, max_keys, filters_json, generated_at_utc
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(name) DO UPDATE SET
-              count=excluded.count,
-              first_rowid=excluded.first_rowid,
-              last_rowid=excluded.last_rowid,
-              first_trace_id=excluded.first_trace_id,
-              last_trace_id=excluded.last_trace_id,
-              first_blob_prefix_hex=excluded.first_blob_prefix_hex,
-              last_blob_prefix_hex=excluded.last_blob_prefix_hex,
-              source_db_path=excluded.source_db_path,
-              max_keys=excluded.max_keys,
-              filters_json=excluded.filters_json,
-              generated_at_utc=excluded.generated_at_utc
-            """,
-            (
+            fs = dict_or_empty(t, "first_seen")
+            ls = dict_or_empty(t, "last_seen")
+
+            first_rowid = fs.get("rowid") if isinstance(fs.get("rowid"), int) else None
+            last_rowid = ls.get("rowid") if isinstance(ls.get("rowid"), int) else None
+            first_trace_id = fs.get("trace_id") if isinstance(fs.get("trace_id"), str) else None
+            last_trace_id = ls.get("trace_id") if isinstance(ls.get("trace_id"), str) else None
+            first_blob_prefix = blob_prefix_from_id_meta(fs.get("id_meta"))
+            last_blob_prefix = blob_prefix_from_id_meta(ls.get("id_meta"))
+
+            yield (
                 name,
                 count,
                 first_rowid,
@@ -872,13 +1079,43 @@ def ingest_cursor_tool_counts(
                 max_keys,
                 filters_json,
                 generated_at,
-            ),
-        )
+            )
 
+    # One executemany inside the caller's open transaction (sqlite3 begins one
+    # implicitly on the first INSERT; main() commits once at the end).
+    con.executemany(
+        """
+        INSERT INTO cursor_tool_counts(
+          name, count, first_rowid, last_rowid,
+          first_trace_id, last_trace_id,
+          first_blob_prefix_hex, last_blob_prefix_hex,
+          source_db_path, max_keys, filters_json, generated_at_utc
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(name) DO UPDATE SET
+          count=excluded.count,
+          first_rowid=excluded.first_rowid,
+          last_rowid=excluded.last_rowid,
+          first_trace_id=excluded.first_trace_id,
+          last_trace_id=excluded.last_trace_id,
+          first_blob_prefix_hex=excluded.first_blob_prefix_hex,
+          last_blob_prefix_hex=excluded.last_blob_prefix_hex,
+          source_db_path=excluded.source_db_path,
+          max_keys=excluded.max_keys,
+          filters_json=excluded.filters_json,
+          generated_at_utc=excluded.generated_at_utc
+        """,
+        iter_rows(),
+    )
 
+
+# Hot per-event helpers. Identity tests where they are exact: bool cannot be subclassed,
+# and decoded JSON strings are plain str. safe_int keeps isinstance on purpose: it
+# has always passed bools through (stored as 0/1).
 def safe_bool(v: Any) -> Optional[int]:
-    if isinstance(v, bool):
-        return 1 if v else 0
+    if v is True:
+        return 1
+    if v is False:
+        return 0
     return None
 
 
@@ -887,14 +1124,48 @@ def safe_int(v: Any) -> Optional[int]:
 
 
 def safe_str(v: Any) -> Optional[str]:
-    return v if isinstance(v, str) else None
+    return v if type(v) is str else None
+
+
+_EMPTY_DICT: Dict[str, Any] = {}
+
+
+def dict_or_empty(d: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """d[key] if it is a dict, else a shared empty dict (read-only by convention)."""
+    v = d.get(key)
+    return v if isinstance(v, dict) else _EMPTY_DICT
+
+
+def json_str_list(v: Any) -> Optional[str]:
+    """
+    JSON text for a list of strings, else None. (sort_keys has no effect on a list of
+    strings, so this matches the json.dumps(v, sort_keys=True) it replaces.)
+    """
+    if type(v) is list and all(type(x) is str for x in v):
+        return json.dumps(v)
+    return None
+
+
+@functools.lru_cache(maxsize=1024)
+def dump_str_list(xs: tuple[str, ...]) -> str:
+    """
+    JSON text for a short list of strings (same as json.dumps(list(xs))). Goal
+    profiles and musing dimensions repeat across events, so most calls hit the cache.
+    (sort_keys has no effect on lists, so callers don't pass it.)
+    """
+    return json.dumps(xs)
 
 
 def sha256_text(s: Optional[str]) -> Optional[str]:
     if not isinstance(s, str):
         return None
-    h = hashlib.sha256(s.encode("utf-8", errors="ignore")).hexdigest()
-    return h
+    try:
+        # Strict encode is the codec's fast path; only lone surrogates (from JSON
+        # escapes) fail it, and those are dropped exactly as errors="ignore" did.
+        b = s.encode("utf-8")
+    except UnicodeEncodeError:
+        b = s.encode("utf-8", errors="ignore")
+    return hashlib.sha256(b).hexdigest()
 
 
 def parse_tx_trunc_field(v: Any) -> Tuple[Optional[str], Optional[int], Optional[int]]:
@@ -915,35 +1186,56 @@ def parse_tx_trunc_field(v: Any) -> Tuple[Optional[str], Optional[int], Optional
     return (text, safe_bool(truncated), len(text))
 
 
+# First non-whitespace char of a JSON document as json.loads accepts it (whitespace is
+# only space/tab/CR/LF; N and I start NaN/Infinity).
+_JSON_LEAD_RE = re.compile(r"[ \t\n\r]*([^ \t\n\r]?)")
+_JSON_LEAD_CHARS = frozenset('{["-0123456789tfnNI')
+
+
 def try_parse_json(text: Optional[str]) -> Tuple[Optional[Dict[str, Any]], Optional[int]]:
     if not isinstance(text, str):
         return (None, None)
+    # Plain-text tool output is common: reject it without paying for a failed parse
+    # (two, with the stdlib retry in _json_loads).
+    if _JSON_LEAD_RE.match(text).group(1) not in _JSON_LEAD_CHARS:
+        return (None, 0)
     try:
-        obj = json.loads(text)
+        obj = _json_loads(text)
         return (obj if isinstance(obj, dict) else None, 1)
     except Exception:
         return (None, 0)
 
 
-def extract_web_search_extract_metadata_from_result_json(result_obj: Any) -> Dict[str, Any]:
+# Transcript event rows carry fixed-width groups of tool columns; empty groups are shared.
+_TOOL_META_NONE: tuple[Any, ...] = (None,) * 5  # ok, provider, fetch_backend, warning_count, cache_hit
+_WSE_ARGS_NONE: tuple[Any, ...] = (None,) * 16  # wse_requested_provider .. wse_no_network
+_WSE_RES_COUNTS_NONE: tuple[Any, ...] = (None,) * 2  # wse_results_count, wse_top_chunks_count
+
+
+def extract_web_search_extract_metadata_from_result_json(result_obj: Any) -> tuple[Any, ...]:
     """
-    Return small, privacy-safe metadata from a parsed `web_search_extract` result payload.
+    Return small, privacy-safe metadata from a parsed `web_search_extract` result payload,
+    as (tool_ok, tool_provider, tool_fetch_backend, tool_warning_count, tool_cache_hit).
     """
     if not isinstance(result_obj, dict):
-        return {}
-    out: Dict[str, Any] = {}
-    out["tool_ok"] = safe_bool(result_obj.get("ok"))
-    out["tool_provider"] = safe_str(result_obj.get("provider"))
-    out["tool_fetch_backend"] = safe_str(result_obj.get("fetch_backend"))
+        return _TOOL_META_NONE
 
     warnings = result_obj.get("warnings")
+    warning_count = None
     if isinstance(warnings, list):
-        out["tool_warning_count"] = len([x for x in warnings if isinstance(x, (str, dict))])
+        warning_count = len([x for x in warnings if isinstance(x, (str, dict))])
 
     fetch_source = result_obj.get("fetch_source")
+    cache_hit = None
     if isinstance(fetch_source, str):
-        out["tool_cache_hit"] = 1 if fetch_source == "cache" else 0
-    return out
+        cache_hit = 1 if fetch_source == "cache" else 0
+    return (
+        safe_bool(result_obj.get("ok")),
+        safe_str(result_obj.get("provider")),
+        safe_str(result_obj.get("fetch_backend")),
+        warning_count,
+        cache_hit,
+    )
 
 
 def extract_llm_score(parsed: Any) -> Optional[float]:
@@ -955,6 +1247,75 @@ def extract_llm_score(parsed: Any) -> Optional[float]:
     return None
 
 
+# Exact severity spellings map straight to a P0/P1/P2 slot; anything else (padding,
+# other casing) takes the general strip().upper() path.
+_SEVERITY_SLOTS: Dict[str, int] = {"P0": 0, "P1": 1, "P2": 2, "p0": 0, "p1": 1, "p2": 2}
+
+
+def count_severities(issues: list[Any]) -> tuple[int, int, int]:
+    """(P0, P1, P2) counts over VLM issue dicts; other severities are ignored."""
+    counts = [0, 0, 0]
+    for it in issues:
+        if not isinstance(it, dict):
+            continue
+        sev = it.get("severity")
+        if not isinstance(sev, str):
+            continue
+        slot = _SEVERITY_SLOTS.get(sev)
+        if slot is None:
+            slot = _SEVERITY_SLOTS.get(sev.strip().upper())
+        if slot is not None:
+            counts[slot] += 1
+    return counts[0], counts[1], counts[2]
+
+
+def extract_judge_musing_dimensions(mus: Any) -> tuple[list[str], int]:
+    """
+    Unique musing dimensions (first-seen order) and how many entries were unusable
+    (not a dict, no string dimension, blank, or longer than 32 chars).
+    """
+    dims: list[str] = []
+    unk = 0
+    if isinstance(mus, list):
+        for it in mus:
+            if not isinstance(it, dict):
+                unk += 1
+                continue
+            d = it.get("dimension")
+            if not isinstance(d, str):
+                unk += 1
+                continue
+            dd = d.strip()
+            if not dd or len(dd) > 32:
+                unk += 1
+                continue
+            if dd not in dims:
+                dims.append(dd)
+    return dims, unk
+
+
+# stage -> (required keys, (key, required type) pairs). Tight on purpose: the VLM and
+# critic schemas exist to catch prose drift.
+_STAGE_SCHEMAS: Dict[str, tuple[frozenset[str], tuple[tuple[str, type], ...]]] = {
+    "judge": (
+        frozenset({"overall_score", "relevant", "answerable", "confidence", "issues"}),
+        (("issues", list),),
+    ),
+    "judge_overall": (
+        frozenset({"overall_assessment", "top_failure_modes", "recommended_defaults", "confidence"}),
+        (("top_failure_modes", list), ("recommended_defaults", dict)),
+    ),
+    "vlm_openrouter": (
+        frozenset({"overall", "score_0_10", "verdict", "strengths", "issues", "top_3_fixes"}),
+        (("strengths", list), ("issues", list), ("top_3_fixes", list)),
+    ),
+    "critic": (
+        frozenset({"issues", "structured_ok", "markdown_ok", "results_count", "top_chunks_count"}),
+        (("issues", list),),
+    ),
+}
+
+
 def schema_ok_for_stage(stage: Optional[str], parsed: Any) -> Optional[int]:
     """
     Best-effort schema validation for judge outputs (no raw text stored).
@@ -964,945 +1325,1275 @@ def schema_ok_for_stage(stage: Optional[str], parsed: Any) -> Optional[int]:
         return None
     if not isinstance(parsed, dict):
         return 0
-    if stage == "judge":
-        need = ["overall_score", "relevant", "answerable", "confidence", "issues"]
-        if not all(k in parsed for k in need):
-            return 0
-        if not isinstance(parsed.get("issues"), list):
-            return 0
-        return 1
-    if stage == "judge_overall":
-        need = ["overall_assessment", "top_failure_modes", "recommended_defaults", "confidence"]
-        if not all(k in parsed for k in need):
-            return 0
-        if not isinstance(parsed.get("top_failure_modes"), list):
-            return 0
-        if not isinstance(parsed.get("recommended_defaults"), dict):
-            return 0
-        return 1
-    if stage == "vlm_openrouter":
-        # VLM critique schema (tight; avoids prose drift).
-        need = ["overall", "score_0_10", "verdict", "strengths", "issues", "top_3_fixes"]
-        if not all(k in parsed for k in need):
-            return 0
-        if not isinstance(parsed.get("strengths"), list):
-            return 0
-        if not isinstance(parsed.get("issues"), list):
-            return 0
-        if not isinstance(parsed.get("top_3_fixes"), list):
-            return 0
-        return 1
-    if stage == "critic":
-        # Deterministic critic schema (tight; avoids prose drift).
-        need = ["issues", "structured_ok", "markdown_ok", "results_count", "top_chunks_count"]
-        if not all(k in parsed for k in need):
-            return 0
-        if not isinstance(parsed.get("issues"), list):
+    schema = _STAGE_SCHEMAS.get(stage) if stage is not None else None
+    if schema is None:
+        # Other LLM-ish stages exist (meta/task_solve); keep unknown.
+        return None
+    need, typed = schema
+    if not parsed.keys() >= need:
+        return 0
+    for k, t in typed:
+        if not isinstance(parsed[k], t):
             return 0
-        return 1
-    # Other LLM-ish stages exist (meta/task_solve); keep unknown.
-    return None
+    return 1
+
+
+# Events are inserted in executemany batches (one prepared statement, far fewer
+# Python -> SQLite round trips); main() commits the whole ingest as one transaction.
+_TRANSCRIPT_EVENT_BATCH_ROWS = 5000
+_TRANSCRIPT_EVENT_INSERT_SQL = """
+INSERT INTO webpipe_transcript_events(
+  src_path, seq, generated_at_epoch_s, run_kind, stage, call_id,
+  tool_name, tool_elapsed_ms, tool_ok, tool_provider, tool_fetch_backend,
+  tool_warning_count, tool_cache_hit,
+  tool_args_truncated, tool_result_truncated, tool_args_json_ok, tool_result_json_ok,
+  tool_args_sha256, tool_result_sha256,
+  wse_requested_provider, wse_auto_mode, wse_selection_mode, wse_fetch_backend,
+  wse_agentic, wse_agentic_selector, wse_url_selection_mode,
+  wse_max_urls, wse_max_chars, wse_top_chunks, wse_max_chunk_chars,
+  wse_include_text, wse_include_links, wse_cache_read, wse_cache_write, wse_no_network,
+  wse_results_count, wse_top_chunks_count,
+  attempt, llm_backend, llm_model_effective, llm_json_mode, llm_timeout_ms,
+  llm_timing_ms, llm_error_present, llm_parse_ok, llm_schema_ok,
+  prompt_system_chars, prompt_user_chars, prompt_truncated,
+  prompt_system_sha256, prompt_user_sha256,
+  response_raw_chars, response_raw_truncated,
+  response_raw_sha256,
+  llm_overall_score,
+  judge_ctx_observed_url_count, judge_ctx_warnings_count, judge_ctx_evidence_chars, judge_ctx_evidence_truncated,
+  judge_musings_count, judge_musing_dimensions_json, judge_musing_dimensions_unknown_count,
+  vlm_profile, vlm_goal_profiles_json,
+  vlm_score_0_10, vlm_verdict, vlm_issues_count,
+  vlm_p0_count, vlm_p1_count, vlm_p2_count,
+  vlm_top_3_fixes_json,
+  critic_issues_json, critic_issues_norm_json, critic_issues_unknown_count,
+  critic_markdown_ok, critic_structured_ok
+) VALUES (
+  ?, ?, ?, ?, ?, ?,
+  ?, ?, ?, ?, ?,
+  ?, ?,
+  ?, ?, ?, ?,
+  ?, ?,
+  ?, ?, ?, ?,
+  ?, ?, ?,
+  ?, ?, ?, ?,
+  ?, ?, ?, ?, ?,
+  ?, ?,
+  ?, ?, ?, ?, ?,
+  ?, ?, ?, ?,
+  ?, ?, ?,
+  ?, ?,
+  ?, ?,
+  ?,
+  ?,
+  ?, ?, ?, ?,
+  ?, ?, ?,
+  ?, ?,
+  ?, ?, ?,
+  ?, ?, ?,
+  ?,
+  ?, ?, ?,
+  ?, ?
+)
+"""
 
 
-def ingest_webpipe_transcripts(con: sqlite3.Connection, webpipe_root: Path) -> Tuple[int, int]:
+def iter_transcript_files(root: Path) -> Iterator[tuple[Path, os.stat_result]]:
     """
-    Scan for `*.transcript.jsonl` under webpipe root and ingest.
-    Returns (files_ingested, events_ingested).
+    Yield (path, stat) for transcript files under `root`, in os.walk's top-down order.
+    Uses os.scandir directly: directory entries carry their type, so only matching
+    files are stat'ed. Dot dirs are included; symlinked dirs are not followed.
     """
-    files = []
-    for dirpath, dirnames, filenames in os.walk(webpipe_root):
-        # include dot dirs; don't modify dirnames
-        for fn in filenames:
+    stack = [os.fspath(root)]
+    while stack:
+        d = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        subdirs: list[str] = []
+        for e in entries:
+            try:
+                is_dir = e.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if not e.is_symlink():
+                    subdirs.append(e.path)
+                continue
+            fn = e.name
             # Historically, transcripts were named `*.transcript.jsonl`, but some commands/tests
             # use custom names. Treat "contains 'transcript' + endswith .jsonl" as a transcript.
-            if fn.endswith(".transcript.jsonl") or ("transcript" in fn and fn.endswith(".jsonl")):
-                files.append(Path(dirpath) / fn)
+            if fn.endswith(".jsonl") and "transcript" in fn:
+                try:
+                    st = e.stat()
+                except OSError:
+                    continue
+                yield Path(e.path), st
+        stack.extend(reversed(subdirs))
 
-    files_ingested = 0
-    events_ingested = 0
 
-    for p in files:
-        try:
-            st = p.stat()
-        except OSError:
-            continue
+def _iter_universal_lines(f: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Lines of a binary file split like text mode's universal newlines (`\n`, `\r\n`
+    and a bare `\r` all end a line), so line counts match the old text-mode reads.
+    """
+    for raw_line in f:
+        if b"\r" in raw_line:
+            yield from raw_line.replace(b"\r\n", b"\n").replace(b"\r", b"\n").splitlines(keepends=True)
+        else:
+            yield raw_line
 
-        con.execute(
-            "INSERT OR REPLACE INTO webpipe_transcript_files(path, mtime_epoch_s, bytes) VALUES (?, ?, ?)",
-            (str(p), int(st.st_mtime), int(st.st_size)),
-        )
-        files_ingested += 1
 
-        with p.open("r", encoding="utf-8", errors="ignore") as f:
-            for line in f:
-                line = line.strip()
+def parse_transcript_file(src_path: str, start: int = 0) -> tuple[list[tuple[Any, ...]], int, bool]:
+    """
+    Parse one transcript from byte offset `start` into webpipe_transcript_events rows
+    (column order of _TRANSCRIPT_EVENT_INSERT_SQL).
+    Returns (rows, end_offset, complete); `complete` is False when the last line had no
+    trailing newline. No DB access, so files can be parsed in worker processes.
+    """
+    rows: list[tuple[Any, ...]] = []
+    # Binary mode so the byte offset of each line is known.
+    offset = start
+    complete = True
+
+    def chunks(f: Iterable[bytes]) -> Iterator[bytes]:
+        # Offsets advance per `\n`-terminated chunk; a chunk may hold several
+        # `\r`-separated events, which _iter_universal_lines splits apart.
+        nonlocal offset, complete
+        for chunk in f:
+            offset += len(chunk)
+            complete = chunk.endswith(b"\n")
+            yield chunk
+
+    with open(src_path, "rb") as f:
+        if start:
+            f.seek(start)
+        for raw_line in _iter_universal_lines(chunks(f)):
+            # Blank (or one-byte, hence never an object) line.
+            if len(raw_line) <= 1:
+                continue
+            # Well-formed UTF-8 JSON parses straight from bytes; anything else gets the
+            # lenient decode (invalid bytes dropped) + strip it always had.
+            try:
+                ev = _json_loads(raw_line)
+            except Exception:
+                line = raw_line.decode("utf-8", errors="ignore").strip()
                 if not line:
                     continue
                 try:
-                    ev = json.loads(line)
+                    ev = _json_loads(line)
                 except Exception:
                     continue
-                if not isinstance(ev, dict):
-                    continue
-                if ev.get("kind") != "webpipe_eval_transcript_event":
-                    continue
-
-                run_kind = safe_str(ev.get("run_kind"))
-                stage = safe_str(ev.get("stage"))
-                call_id = safe_str(ev.get("call_id"))
-                seq = safe_int(ev.get("seq"))
-                generated_at_epoch_s = safe_int(ev.get("generated_at_epoch_s"))
-
-                tool_name = None
-                tool_elapsed_ms = None
-                tool_meta: Dict[str, Any] = {}
-                tool_args_truncated = None
-                tool_result_truncated = None
-                tool_args_json_ok = None
-                tool_result_json_ok = None
-                tool_args_sha = None
-                tool_result_sha = None
-                wse_args: Dict[str, Any] = {}
-                wse_res_counts: Dict[str, Any] = {}
-
-                tool = ev.get("tool")
-                if isinstance(tool, dict):
-                    tool_name = safe_str(tool.get("name"))
-                    tool_elapsed_ms = safe_int(tool.get("elapsed_ms"))
-                    # Tool args are stored as `json_trunc` => {text, truncated}.
-                    # Tool results are increasingly stored as structured `result_summary` to avoid
-                    # JSON truncation (which would make downstream analysis misleading).
-                    args_text, tool_args_truncated, _args_chars = parse_tx_trunc_field(tool.get("args"))
-                    res_text, tool_result_truncated, _res_chars = parse_tx_trunc_field(tool.get("result"))
-                    tool_args_sha = sha256_text(args_text)
-                    tool_result_sha = sha256_text(res_text)
-
-                    args_json, tool_args_json_ok = try_parse_json(args_text)
-                    res_json, tool_result_json_ok = try_parse_json(res_text)
-
-                    # Only attempt structured extraction if parse succeeded and the JSON wasn't truncated.
-                    if tool_name == "web_search_extract":
-                        # Prefer result_summary when present (parseable + bounded).
-                        rs0 = tool.get("result_summary")
-                        if isinstance(rs0, dict):
-                            # These are the fields we currently log in transcripts.
-                            wse_res_counts = {
-                                "wse_results_count": safe_int(rs0.get("results_count")),
-                                "wse_top_chunks_count": safe_int(rs0.get("top_chunks_count")),
-                            }
-                            tool_meta["tool_ok"] = safe_bool(rs0.get("ok"))
-                            tool_meta["tool_provider"] = safe_str(rs0.get("provider"))
-                            tool_meta["tool_fetch_backend"] = safe_str(rs0.get("fetch_backend"))
-
-                        if args_json is not None:
-                            # Capture knobs that matter for analysis (all scalar/bool).
-                            wse_args = {
-                                "wse_requested_provider": safe_str(args_json.get("provider")),
-                                "wse_auto_mode": safe_str(args_json.get("auto_mode")),
-                                "wse_selection_mode": safe_str(args_json.get("selection_mode")),
-                                "wse_fetch_backend": safe_str(args_json.get("fetch_backend")),
-                                "wse_agentic": safe_bool(args_json.get("agentic")),
-                                "wse_agentic_selector": safe_str(args_json.get("agentic_selector")),
-                                "wse_url_selection_mode": safe_str(args_json.get("url_selection_mode")),
-                                "wse_max_urls": safe_int(args_json.get("max_urls")),
-                                "wse_max_chars": safe_int(args_json.get("max_chars")),
-                                "wse_top_chunks": safe_int(args_json.get("top_chunks")),
-                                "wse_max_chunk_chars": safe_int(args_json.get("max_chunk_chars")),
-                                "wse_include_text": safe_bool(args_json.get("include_text")),
-                                "wse_include_links": safe_bool(args_json.get("include_links")),
-                                "wse_cache_read": safe_bool(args_json.get("cache_read")),
-                                "wse_cache_write": safe_bool(args_json.get("cache_write")),
-                                "wse_no_network": safe_bool(args_json.get("no_network")),
-                            }
-                        if res_json is not None and not wse_res_counts:
-                            tool_meta = extract_web_search_extract_metadata_from_result_json(res_json)
-                            # Counts only (no text).
-                            rs = res_json.get("results")
-                            tc = res_json.get("top_chunks")
-                            wse_res_counts = {
-                                "wse_results_count": len(rs) if isinstance(rs, list) else None,
-                                "wse_top_chunks_count": len(tc) if isinstance(tc, list) else None,
-                            }
-                    elif res_json is not None and isinstance(res_json, dict):
-                        tool_meta["tool_ok"] = safe_bool(res_json.get("ok"))
-
-                attempt = safe_int(ev.get("attempt"))
-                llm = ev.get("llm") if isinstance(ev.get("llm"), dict) else None
-                llm_backend = safe_str(llm.get("backend")) if llm else None
-                llm_model_effective = safe_str(llm.get("model_effective")) if llm else None
-                llm_json_mode = safe_bool(llm.get("json_mode")) if llm else None
-                llm_timeout_ms = safe_int(llm.get("timeout_ms")) if llm else None
-                llm_timing_ms = safe_int(ev.get("timing_ms"))
-
-                prompt_system_chars = None
-                prompt_user_chars = None
-                prompt_truncated = None
-                prompt_system_sha = None
-                prompt_user_sha = None
-                vlm_profile = None
-                vlm_goal_profiles_json = None
-                prompt = ev.get("prompt") if isinstance(ev.get("prompt"), dict) else None
-                if prompt:
-                    sys_text, sys_tr, sys_chars = parse_tx_trunc_field(prompt.get("system"))
-                    usr_text, usr_tr, usr_chars = parse_tx_trunc_field(prompt.get("user"))
-                    prompt_system_chars = sys_chars
-                    prompt_user_chars = usr_chars
-                    prompt_system_sha = sha256_text(sys_text)
-                    prompt_user_sha = sha256_text(usr_text)
-                    # prompt_truncated is true if either field was truncated, or explicit flag exists.
-                    pt = prompt.get("prompt_truncated")
-                    pt_b = safe_bool(pt)
-                    if pt_b is None:
-                        if sys_tr == 1 or usr_tr == 1:
-                            prompt_truncated = 1
-                        elif sys_tr == 0 and usr_tr == 0:
-                            prompt_truncated = 0
-                    else:
-                        prompt_truncated = pt_b
-
-                    # VLM prompt metadata (small + aggregatable).
-                    vlm_profile = safe_str(prompt.get("profile"))
-                    gps = prompt.get("goal_profiles")
-                    if isinstance(gps, list) and all(isinstance(x, str) for x in gps):
-                        vlm_goal_profiles_json = json.dumps(gps, sort_keys=True)
-
-                response_raw_chars = None
-                response_raw_truncated = None
-                response_raw_sha = None
-                resp = ev.get("response") if isinstance(ev.get("response"), dict) else None
-                llm_error_present = None
-                llm_parse_ok = None
-                llm_schema_ok = None
-                llm_overall_score = None
-                critic_issues_json = None
-                critic_issues_norm_json = None
-                critic_issues_unknown_count = None
-                critic_markdown_ok = None
-                critic_structured_ok = None
-                judge_ctx_observed_url_count = None
-                judge_ctx_warnings_count = None
-                judge_ctx_evidence_chars = None
-                judge_ctx_evidence_truncated = None
-                judge_musings_count = None
-                judge_musing_dimensions_json = None
-                judge_musing_dimensions_unknown_count = None
-                vlm_score_0_10 = None
-                vlm_verdict = None
-                vlm_issues_count = None
-                vlm_p0_count = None
-                vlm_p1_count = None
-                vlm_p2_count = None
-                vlm_top_3_fixes_json = None
-                if resp:
-                    err = resp.get("error")
-                    llm_error_present = 1 if (isinstance(err, str) and err.strip()) else 0
-                    parsed = resp.get("parsed")
-                    llm_parse_ok = 1 if parsed is not None else 0
-                    llm_overall_score = extract_llm_score(parsed)
-                    llm_schema_ok = schema_ok_for_stage(stage, parsed)
+            if not isinstance(ev, dict):
+                continue
+            if ev.get("kind") != "webpipe_eval_transcript_event":
+                continue
 
+            run_kind = safe_str(ev.get("run_kind"))
+            stage = safe_str(ev.get("stage"))
+            call_id = safe_str(ev.get("call_id"))
+            seq = safe_int(ev.get("seq"))
+            generated_at_epoch_s = safe_int(ev.get("generated_at_epoch_s"))
+
+            tool_name = None
+            tool_elapsed_ms = None
+            tool_meta = _TOOL_META_NONE
+            tool_args_truncated = None
+            tool_result_truncated = None
+            tool_args_json_ok = None
+            tool_result_json_ok = None
+            tool_args_sha = None
+            tool_result_sha = None
+            wse_args = _WSE_ARGS_NONE
+            wse_res_counts = _WSE_RES_COUNTS_NONE
+
+            tool = ev.get("tool")
+            if isinstance(tool, dict):
+                tool_name = safe_str(tool.get("name"))
+                tool_elapsed_ms = safe_int(tool.get("elapsed_ms"))
+                # Tool args are stored as `json_trunc` => {text, truncated}.
+                # Tool results are increasingly stored as structured `result_summary` to avoid
+                # JSON truncation (which would make downstream analysis misleading).
+                args_text, tool_args_truncated, _args_chars = parse_tx_trunc_field(tool.get("args"))
+                res_text, tool_result_truncated, _res_chars = parse_tx_trunc_field(tool.get("result"))
+                tool_args_sha = sha256_text(args_text)
+                tool_result_sha = sha256_text(res_text)
+
+                args_json, tool_args_json_ok = try_parse_json(args_text)
+                res_json, tool_result_json_ok = try_parse_json(res_text)
+
+                # Only attempt structured extraction if parse succeeded and the JSON wasn't truncated.
+                if tool_name == "web_search_extract":
+                    # Prefer result_summary when present (parseable + bounded).
+                    rs0 = tool.get("result_summary")
+                    if isinstance(rs0, dict):
+                        # These are the fields we currently log in transcripts.
+                        wse_res_counts = (
+                            safe_int(rs0.get("results_count")),
+                            safe_int(rs0.get("top_chunks_count")),
+                        )
+                        tool_meta = (
+                            safe_bool(rs0.get("ok")),
+                            safe_str(rs0.get("provider")),
+                            safe_str(rs0.get("fetch_backend")),
+                            None,
+                            None,
+                        )
+
+                    if args_json is not None:
+                        # Capture knobs that matter for analysis (all scalar/bool), in
+                        # wse_requested_provider .. wse_no_network column order.
+                        wse_args = (
+                            safe_str(args_json.get("provider")),
+                            safe_str(args_json.get("auto_mode")),
+                            safe_str(args_json.get("selection_mode")),
+                            safe_str(args_json.get("fetch_backend")),
+                            safe_bool(args_json.get("agentic")),
+                            safe_str(args_json.get("agentic_selector")),
+                            safe_str(args_json.get("url_selection_mode")),
+                            safe_int(args_json.get("max_urls")),
+                            safe_int(args_json.get("max_chars")),
+                            safe_int(args_json.get("top_chunks")),
+                            safe_int(args_json.get("max_chunk_chars")),
+                            safe_bool(args_json.get("include_text")),
+                            safe_bool(args_json.get("include_links")),
+                            safe_bool(args_json.get("cache_read")),
+                            safe_bool(args_json.get("cache_write")),
+                            safe_bool(args_json.get("no_network")),
+                        )
+                    if res_json is not None and wse_res_counts is _WSE_RES_COUNTS_NONE:
+                        tool_meta = extract_web_search_extract_metadata_from_result_json(res_json)
+                        # Counts only (no text).
+                        rs = res_json.get("results")
+                        tc = res_json.get("top_chunks")
+                        wse_res_counts = (
+                            len(rs) if isinstance(rs, list) else None,
+                            len(tc) if isinstance(tc, list) else None,
+                        )
+                elif res_json is not None and isinstance(res_json, dict):
+                    tool_meta = (safe_bool(res_json.get("ok")), None, None, None, None)
+
+            attempt = safe_int(ev.get("attempt"))
+            llm = ev.get("llm")
+            if not isinstance(llm, dict):
+                llm = None
+            llm_backend = safe_str(llm.get("backend")) if llm else None
+            llm_model_effective = safe_str(llm.get("model_effective")) if llm else None
+            llm_json_mode = safe_bool(llm.get("json_mode")) if llm else None
+            llm_timeout_ms = safe_int(llm.get("timeout_ms")) if llm else None
+            llm_timing_ms = safe_int(ev.get("timing_ms"))
+
+            prompt_system_chars = None
+            prompt_user_chars = None
+            prompt_truncated = None
+            prompt_system_sha = None
+            prompt_user_sha = None
+            vlm_profile = None
+            vlm_goal_profiles_json = None
+            prompt = ev.get("prompt")
+            if not isinstance(prompt, dict):
+                prompt = None
+            if prompt:
+                sys_text, sys_tr, sys_chars = parse_tx_trunc_field(prompt.get("system"))
+                usr_text, usr_tr, usr_chars = parse_tx_trunc_field(prompt.get("user"))
+                prompt_system_chars = sys_chars
+                prompt_user_chars = usr_chars
+                prompt_system_sha = sha256_text(sys_text)
+                prompt_user_sha = sha256_text(usr_text)
+                # prompt_truncated is true if either field was truncated, or explicit flag exists.
+                pt = prompt.get("prompt_truncated")
+                pt_b = safe_bool(pt)
+                if pt_b is None:
+                    if sys_tr == 1 or usr_tr == 1:
+                        prompt_truncated = 1
+                    elif sys_tr == 0 and usr_tr == 0:
+                        prompt_truncated = 0
+                else:
+                    prompt_truncated = pt_b
+
+                # VLM prompt metadata (small + aggregatable).
+                vlm_profile = safe_str(prompt.get("profile"))
+                gps = prompt.get("goal_profiles")
+                if isinstance(gps, list) and all(isinstance(x, str) for x in gps):
+                    vlm_goal_profiles_json = dump_str_list(tuple(gps))
+
+            response_raw_chars = None
+            response_raw_truncated = None
+            response_raw_sha = None
+            resp = ev.get("response")
+            if not isinstance(resp, dict):
+                resp = None
+            llm_error_present = None
+            llm_parse_ok = None
+            llm_schema_ok = None
+            llm_overall_score = None
+            critic_issues_json = None
+            critic_issues_norm_json = None
+            critic_issues_unknown_count = None
+            critic_markdown_ok = None
+            critic_structured_ok = None
+            judge_ctx_observed_url_count = None
+            judge_ctx_warnings_count = None
+            judge_ctx_evidence_chars = None
+            judge_ctx_evidence_truncated = None
+            judge_musings_count = None
+            judge_musing_dimensions_json = None
+            judge_musing_dimensions_unknown_count = None
+            vlm_score_0_10 = None
+            vlm_verdict = None
+            vlm_issues_count = None
+            vlm_p0_count = None
+            vlm_p1_count = None
+            vlm_p2_count = None
+            vlm_top_3_fixes_json = None
+            if resp:
+                err = resp.get("error")
+                llm_error_present = 1 if (isinstance(err, str) and err.strip()) else 0
+                parsed = resp.get("parsed")
+                llm_parse_ok = 1 if parsed is not None else 0
+                llm_overall_score = extract_llm_score(parsed)
+                llm_schema_ok = schema_ok_for_stage(stage, parsed)
+
+                # One extraction block per stage (an event matches at most one).
+                if stage == "judge":
                     # Judge context completeness (counts only; privacy-safe).
-                    if stage == "judge":
-                        ctx = ev.get("context") if isinstance(ev.get("context"), dict) else None
-                        if isinstance(ctx, dict):
-                            judge_ctx_observed_url_count = safe_int(ctx.get("observed_url_count"))
-                            judge_ctx_warnings_count = safe_int(ctx.get("warnings_count"))
-                            judge_ctx_evidence_chars = safe_int(ctx.get("evidence_chars"))
-                            judge_ctx_evidence_truncated = safe_bool(ctx.get("evidence_truncated"))
-
-                    # Critic structured extraction (bounded; aggregatable).
-                    if stage == "critic" and isinstance(parsed, dict):
-                        raw, norm, unk = normalize_critic_issue_list(parsed.get("issues"))
-                        critic_issues_json = raw
-                        critic_issues_norm_json = norm
-                        critic_issues_unknown_count = int(unk)
-                        critic_markdown_ok = safe_bool(parsed.get("markdown_ok"))
-                        critic_structured_ok = safe_bool(parsed.get("structured_ok"))
+                    ctx = ev.get("context")
+                    if isinstance(ctx, dict):
+                        judge_ctx_observed_url_count = safe_int(ctx.get("observed_url_count"))
+                        judge_ctx_warnings_count = safe_int(ctx.get("warnings_count"))
+                        judge_ctx_evidence_chars = safe_int(ctx.get("evidence_chars"))
+                        judge_ctx_evidence_truncated = safe_bool(ctx.get("evidence_truncated"))
 
                     # Judge musings: store dimensions only (notes may contain page-specific text).
-                    if stage == "judge" and isinstance(parsed, dict):
-                        mus = parsed.get("musings")
-                        dims: list[str] = []
-                        unk = 0
-                        if isinstance(mus, list):
-                            for it in mus:
-                                if not isinstance(it, dict):
-                                    unk += 1
-                                    continue
-                                d = it.get("dimension")
-                                if not isinstance(d, str):
-                                    unk += 1
-                                    continue
-                                dd = d.strip()
-                                if not dd or len(dd) > 32:
-                                    unk += 1
-                                    continue
-                                if dd not in dims:
-                                    dims.append(dd)
-                        if mus is not None:
-                            judge_musings_count = len(mus) if isinstance(mus, list) else 0
-                            judge_musing_dimensions_json = json.dumps(dims, sort_keys=True)
-                            judge_musing_dimensions_unknown_count = int(unk)
-
-                    # VLM structured extraction (bounded; no raw screenshot content).
-                    if stage == "vlm_openrouter" and isinstance(parsed, dict):
-                        v = parsed.get("score_0_10")
-                        if isinstance(v, (int, float)):
-                            vlm_score_0_10 = float(v)
-                        vv = parsed.get("verdict")
-                        if isinstance(vv, str) and vv.strip():
-                            vlm_verdict = vv.strip()
-                        issues = parsed.get("issues")
-                        if isinstance(issues, list):
-                            vlm_issues_count = len(issues)
-                            p0 = p1 = p2 = 0
-                            for it in issues:
-                                if not isinstance(it, dict):
-                                    continue
-                                sev = it.get("severity")
-                                if not isinstance(sev, str):
-                                    continue
-                                s = sev.strip().upper()
-                                if s == "P0":
-                                    p0 += 1
-                                elif s == "P1":
-                                    p1 += 1
-                                elif s == "P2":
-                                    p2 += 1
-                            vlm_p0_count, vlm_p1_count, vlm_p2_count = p0, p1, p2
-                        t3 = parsed.get("top_3_fixes")
-                        if isinstance(t3, list) and all(isinstance(x, str) for x in t3):
-                            vlm_top_3_fixes_json = json.dumps(t3, sort_keys=True)
-
-                    raw_text, raw_tr, raw_chars = parse_tx_trunc_field(resp.get("raw"))
-                    response_raw_chars = raw_chars
-                    response_raw_truncated = raw_tr
-                    response_raw_sha = sha256_text(raw_text)
-
-                con.execute(
-                    """
-                    INSERT INTO webpipe_transcript_events(
-                      src_path, seq, generated_at_epoch_s, run_kind, stage, call_id,
-                      tool_name, tool_elapsed_ms, tool_ok, tool_provider, tool_fetch_backend,
-                      tool_warning_count, tool_cache_hit,
-                      tool_args_truncated, tool_result_truncated, tool_args_json_ok, tool_result_json_ok,
-                      tool_args_sha256, tool_result_sha256,
-                      wse_requested_provider, wse_auto_mode, wse_selection_mode, wse_fetch_backend,
-                      wse_agentic, wse_agentic_selector, wse_url_selection_mode,
-                      wse_max_urls, wse_max_chars, wse_top_chunks, wse_max_chunk_chars,
-                      wse_include_text, wse_include_links, wse_cache_read, wse_cache_write, wse_no_network,
-                      wse_results_count, wse_top_chunks_count,
-                      attempt, llm_backend, llm_model_effective, llm_json_mode, llm_timeout_ms,
-                      llm_timing_ms, llm_error_present, llm_parse_ok, llm_schema_ok,
-                      prompt_system_chars, prompt_user_chars, prompt_truncated,
-                      prompt_system_sha256, prompt_user_sha256,
-                      response_raw_chars, response_raw_truncated,
-                      response_raw_sha256,
-                      llm_overall_score,
-                      judge_ctx_observed_url_count, judge_ctx_warnings_count, judge_ctx_evidence_chars, judge_ctx_evidence_truncated,
-                      judge_musings_count, judge_musing_dimensions_json, judge_musing_dimensions_unknown_count,
-                      vlm_profile, vlm_goal_profiles_json,
-                      vlm_score_0_10, vlm_verdict, vlm_issues_count,
-                      vlm_p0_count, vlm_p1_count, vlm_p2_count,
-                      vlm_top_3_fixes_json,
-                      critic_issues_json, critic_issues_norm_json, critic_issues_unknown_count,
-                      critic_markdown_ok, critic_structured_ok
-                    ) VALUES (
-                      ?, ?, ?, ?, ?, ?,
-                      ?, ?, ?, ?, ?,
-                      ?, ?,
-                      ?, ?, ?, ?,
-                      ?, ?,
-                      ?, ?, ?, ?,
-                      ?, ?, ?,
-                      ?, ?, ?, ?,
-                      ?, ?, ?, ?, ?,
-                      ?, ?,
-                      ?, ?, ?, ?, ?,
-                      ?, ?, ?, ?,
-                      ?, ?, ?,
-                      ?, ?,
-                      ?, ?,
-                      ?,
-                      ?,
-                      ?, ?, ?, ?,
-                      ?, ?, ?,
-                      ?, ?,
-                      ?, ?, ?,
-                      ?, ?, ?,
-                      ?,
-                      ?, ?, ?,
-                      ?, ?
-                    )
-                    """,
-                    (
-                        str(p),
-                        seq,
-                        generated_at_epoch_s,
-                        run_kind,
-                        stage,
-                        call_id,
-                        tool_name,
-                        tool_elapsed_ms,
-                        tool_meta.get("tool_ok"),
-                        tool_meta.get("tool_provider"),
-                        tool_meta.get("tool_fetch_backend"),
-                        tool_meta.get("tool_warning_count"),
-                        tool_meta.get("tool_cache_hit"),
-                        tool_args_truncated,
-                        tool_result_truncated,
-                        tool_args_json_ok,
-                        tool_result_json_ok,
-                        tool_args_sha,
-                        tool_result_sha,
-                        wse_args.get("wse_requested_provider"),
-                        wse_args.get("wse_auto_mode"),
-                        wse_args.get("wse_selection_mode"),
-                        wse_args.get("wse_fetch_backend"),
-                        wse_args.get("wse_agentic"),
-                        wse_args.get("wse_agentic_selector"),
-                        wse_args.get("wse_url_selection_mode"),
-                        wse_args.get("wse_max_urls"),
-                        wse_args.get("wse_max_chars"),
-                        wse_args.get("wse_top_chunks"),
-                        wse_args.get("wse_max_chunk_chars"),
-                        wse_args.get("wse_include_text"),
-                        wse_args.get("wse_include_links"),
-                        wse_args.get("wse_cache_read"),
-                        wse_args.get("wse_cache_write"),
-                        wse_args.get("wse_no_network"),
-                        wse_res_counts.get("wse_results_count"),
-                        wse_res_counts.get("wse_top_chunks_count"),
-                        attempt,
-                        llm_backend,
-                        llm_model_effective,
-                        llm_json_mode,
-                        llm_timeout_ms,
-                        llm_timing_ms,
-                        llm_error_present,
-                        llm_parse_ok,
-                        llm_schema_ok,
-                        prompt_system_chars,
-                        prompt_user_chars,
-                        prompt_truncated,
-                        prompt_system_sha,
-                        prompt_user_sha,
-                        response_raw_chars,
-                        response_raw_truncated,
-                        response_raw_sha,
-                        llm_overall_score,
-                        judge_ctx_observed_url_count,
-                        judge_ctx_warnings_count,
-                        judge_ctx_evidence_chars,
-                        judge_ctx_evidence_truncated,
-                        judge_musings_count,
-                        judge_musing_dimensions_json,
-                        judge_musing_dimensions_unknown_count,
-                        vlm_profile,
-                        vlm_goal_profiles_json,
-                        vlm_score_0_10,
-                        vlm_verdict,
-                        vlm_issues_count,
-                        vlm_p0_count,
-                        vlm_p1_count,
-                        vlm_p2_count,
-                        vlm_top_3_fixes_json,
-                        critic_issues_json,
-                        critic_issues_norm_json,
-                        critic_issues_unknown_count,
-                        critic_markdown_ok,
-                        critic_structured_ok,
-                    ),
+                    mus = parsed.get("musings") if isinstance(parsed, dict) else None
+                    if mus is not None:
+                        dims, unk = extract_judge_musing_dimensions(mus)
+                        judge_musings_count = len(mus) if isinstance(mus, list) else 0
+                        judge_musing_dimensions_json = dump_str_list(tuple(dims))
+                        judge_musing_dimensions_unknown_count = unk
+
+                # Critic structured extraction (bounded; aggregatable).
+                elif stage == "critic" and isinstance(parsed, dict):
+                    raw, norm, unk = normalize_critic_issue_list(parsed.get("issues"))
+                    critic_issues_json = raw
+                    critic_issues_norm_json = norm
+                    critic_issues_unknown_count = int(unk)
+                    critic_markdown_ok = safe_bool(parsed.get("markdown_ok"))
+                    critic_structured_ok = safe_bool(parsed.get("structured_ok"))
+
+                # VLM structured extraction (bounded; no raw screenshot content).
+                elif stage == "vlm_openrouter" and isinstance(parsed, dict):
+                    v = parsed.get("score_0_10")
+                    if isinstance(v, (int, float)):
+                        vlm_score_0_10 = float(v)
+                    vv = parsed.get("verdict")
+                    if isinstance(vv, str) and vv.strip():
+                        vlm_verdict = vv.strip()
+                    issues = parsed.get("issues")
+                    if isinstance(issues, list):
+                        vlm_issues_count = len(issues)
+                        vlm_p0_count, vlm_p1_count, vlm_p2_count = count_severities(issues)
+                    vlm_top_3_fixes_json = json_str_list(parsed.get("top_3_fixes"))
+
+                raw_text, raw_tr, raw_chars = parse_tx_trunc_field(resp.get("raw"))
+                response_raw_chars = raw_chars
+                response_raw_truncated = raw_tr
+                response_raw_sha = sha256_text(raw_text)
+
+            rows.append(
+                (
+                    src_path,
+                    seq,
+                    generated_at_epoch_s,
+                    run_kind,
+                    stage,
+                    call_id,
+                    tool_name,
+                    tool_elapsed_ms,
+                    *tool_meta,
+                    tool_args_truncated,
+                    tool_result_truncated,
+                    tool_args_json_ok,
+                    tool_result_json_ok,
+                    tool_args_sha,
+                    tool_result_sha,
+                    *wse_args,
+                    *wse_res_counts,
+                    attempt,
+                    llm_backend,
+                    llm_model_effective,
+                    llm_json_mode,
+                    llm_timeout_ms,
+                    llm_timing_ms,
+                    llm_error_present,
+                    llm_parse_ok,
+                    llm_schema_ok,
+                    prompt_system_chars,
+                    prompt_user_chars,
+                    prompt_truncated,
+                    prompt_system_sha,
+                    prompt_user_sha,
+                    response_raw_chars,
+                    response_raw_truncated,
+                    response_raw_sha,
+                    llm_overall_score,
+                    judge_ctx_observed_url_count,
+                    judge_ctx_warnings_count,
+                    judge_ctx_evidence_chars,
+                    judge_ctx_evidence_truncated,
+                    judge_musings_count,
+                    judge_musing_dimensions_json,
+                    judge_musing_dimensions_unknown_count,
+                    vlm_profile,
+                    vlm_goal_profiles_json,
+                    vlm_score_0_10,
+                    vlm_verdict,
+                    vlm_issues_count,
+                    vlm_p0_count,
+                    vlm_p1_count,
+                    vlm_p2_count,
+                    vlm_top_3_fixes_json,
+                    critic_issues_json,
+                    critic_issues_norm_json,
+                    critic_issues_unknown_count,
+                    critic_markdown_ok,
+                    critic_structured_ok,
                 )
-                events_ingested += 1
+            )
+
+    return rows, offset, complete
+
+
+# Below this many bytes to read, worker start-up costs more than it saves.
+_POOL_MIN_BYTES = 8 << 20
 
-    return files_ingested, events_ingested
+_TRANSCRIPT_FILE_UPSERT_SQL = """
+INSERT INTO webpipe_transcript_files(path, mtime_epoch_s, bytes) VALUES (?, ?, ?)
+ON CONFLICT(path) DO UPDATE SET mtime_epoch_s=excluded.mtime_epoch_s, bytes=excluded.bytes
+"""
+
+# Flushes the parser may run ahead of the writer thread (bounds buffered rows).
+_WRITER_QUEUE_MAX = 64
 
 
-def _ingest_eval_file_record(con: sqlite3.Connection, p: Path, kind: Optional[str], schema_version: Optional[int], generated_at: Optional[int]) -> None:
+def _run_writer(con: sqlite3.Connection, q: "queue.Queue[Optional[list[tuple[str, list[Any]]]]]", errors: list[BaseException]) -> None:
+    """
+    Apply queued flushes (lists of (sql, executemany params), in order) until the None
+    sentinel. After a failure, keep draining so the producer never blocks on a full queue.
+    """
+    while True:
+        flush = q.get()
+        if flush is None:
+            return
+        if errors:
+            continue
+        try:
+            for sql, params in flush:
+                if params:
+                    con.executemany(sql, params)
+        except BaseException as e:
+            errors.append(e)
+
+
+def ingest_webpipe_transcripts(con: sqlite3.Connection, webpipe_root: Path) -> Tuple[int, int]:
+    """
+    Scan for `*.transcript.jsonl` under webpipe root and ingest.
+    Returns (files, events) now stored: on an --incremental run these include skipped
+    and resumed files' earlier events, so they match what a fresh export reports.
+
+    Files already recorded in webpipe_transcript_files (i.e. an --incremental run
+    over an existing DB) are skipped when mtime and size are unchanged, resumed
+    from `last_offset` when they only grew (transcripts are append-only), and
+    otherwise re-ingested from scratch. Rows for files that disappeared are dropped.
+
+    Large ingests parse files in a process pool. All writes go through one writer
+    thread, so parsing continues while SQLite inserts; `con` is not used by this thread
+    until the writer has finished.
+    """
+    known: Dict[str, tuple[Optional[int], Optional[int], Optional[int]]] = {
+        path: (mtime, size, last_offset)
+        for path, mtime, size, last_offset in con.execute(
+            "SELECT path, mtime_epoch_s, bytes, last_offset FROM webpipe_transcript_files"
+        )
+    }
+    seen: set[str] = set()
+
+    # (src_path, mtime, size, start offset, drop existing events first)
+    jobs: list[tuple[str, int, int, int, bool]] = []
+    for p, st in iter_transcript_files(webpipe_root):
+        src_path = str(p)
+        mtime, size = int(st.st_mtime), int(st.st_size)
+        seen.add(src_path)
+        start = 0
+        reset = False
+        prev = known.get(src_path)
+        if prev is not None:
+            prev_mtime, prev_size, prev_offset = prev
+            if prev_mtime == mtime and prev_size == size:
+                continue
+            if prev_offset is not None and prev_size is not None and size > prev_size:
+                start = prev_offset
+            else:
+                reset = True
+        jobs.append((src_path, mtime, size, start, reset))
+
+    paths = [j[0] for j in jobs]
+    starts = [j[3] for j in jobs]
+    pool: Optional[ProcessPoolExecutor] = None
+    if len(jobs) > 1 and sum(max(0, j[2] - j[3]) for j in jobs) >= _POOL_MIN_BYTES:
+        pool = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(jobs)))
+        results = pool.map(parse_transcript_file, paths, starts, chunksize=4)
+    else:
+        results = map(parse_transcript_file, paths, starts)
+
+    q: "queue.Queue[Optional[list[tuple[str, list[Any]]]]]" = queue.Queue(maxsize=_WRITER_QUEUE_MAX)
+    errors: list[BaseException] = []
+    writer = threading.Thread(target=_run_writer, args=(con, q, errors), name="transcript-writer", daemon=True)
+    writer.start()
+
+    files_ingested = 0
+    events_ingested = 0
+    # Pending writes; the writer owns each list once queued, so start new ones after a flush.
+    resets: list[tuple[str]] = []
+    files: list[tuple[str, int, int]] = []
+    offsets: list[tuple[Optional[int], str]] = []
+    rows: list[tuple[Any, ...]] = []
+
+    def flush() -> None:
+        # Parent rows before events: event rows reference them (foreign_keys=ON). A file's
+        # events are never split across flushes, so its reset DELETE always precedes them.
+        q.put(
+            [
+                ("DELETE FROM webpipe_transcript_events WHERE src_path=?", resets),
+                (_TRANSCRIPT_FILE_UPSERT_SQL, files),
+                ("UPDATE webpipe_transcript_files SET last_offset=? WHERE path=?", offsets),
+                (_TRANSCRIPT_EVENT_INSERT_SQL, rows),
+            ]
+        )
+
     try:
-        st = p.stat()
-    except OSError:
-        return
+        for (src_path, mtime, size, _start, reset), (file_rows, offset, complete) in zip(jobs, results):
+            if reset:
+                resets.append((src_path,))
+            files.append((src_path, mtime, size))
+            # An unterminated last line may still be mid-write: no resume point, re-read next time.
+            offsets.append((offset if complete else None, src_path))
+            files_ingested += 1
+            events_ingested += len(file_rows)
+            rows.extend(file_rows)
+            if len(rows) >= _TRANSCRIPT_EVENT_BATCH_ROWS:
+                flush()
+                resets, files, offsets, rows = [], [], [], []
+            if errors:
+                break
+        if files:
+            flush()
+    finally:
+        q.put(None)
+        writer.join()
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    if errors:
+        raise errors[0]
+
+    gone = [(path,) for path in known if path not in seen]
+    if gone:
+        con.executemany("DELETE FROM webpipe_transcript_events WHERE src_path=?", gone)
+        con.executemany("DELETE FROM webpipe_transcript_files WHERE path=?", gone)
+    if known:
+        # Unchanged files weren't read and resumed ones only from their offset.
+        events_ingested = con.execute("SELECT COUNT(*) FROM webpipe_transcript_events").fetchone()[0]
+    # Every discovered file now has its webpipe_transcript_files row.
+    return len(seen), events_ingested
+
+
+# Bump when artifact extraction changes: --incremental then re-reads every artifact
+# instead of trusting rows written by older code.
+_EVAL_ARTIFACT_INGEST_VERSION = 1
+
+
+def _ingest_eval_file_record(
+    con: sqlite3.Connection,
+    p: Path,
+    kind: Optional[str],
+    schema_version: Optional[int],
+    generated_at: Optional[int],
+    st: Optional[os.stat_result] = None,
+) -> None:
+    if st is None:
+        try:
+            st = p.stat()
+        except OSError:
+            return
     con.execute(
         """
-        INSERT OR REPLACE INTO webpipe_eval_artifact_files(path, kind, schema_version, generated_at_epoch_s, mtime_epoch_s, bytes)
-        VALUES (?, ?, ?, ?, ?, ?)
+        INSERT OR REPLACE INTO webpipe_eval_artifact_files(
+          path, kind, schema_version, generated_at_epoch_s, mtime_epoch_s, bytes, ingest_version
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
         """,
-        (str(p), kind, schema_version, generated_at, int(st.st_mtime), int(st.st_size)),
+        (str(p), kind, schema_version, generated_at, int(st.st_mtime), int(st.st_size), _EVAL_ARTIFACT_INGEST_VERSION),
     )
 
 
+# Judge-swarm tables keyed by run_key, children before parents.
+_JUDGE_SWARM_TABLES: tuple[str, ...] = (
+    "webpipe_eval_judge_trials",
+    "webpipe_eval_judge_agent_reports",
+    "webpipe_eval_judge_meta",
+    "webpipe_eval_judge_swarm_runs",
+)
+
+
+def _delete_judge_swarm_runs(con: sqlite3.Connection, run_keys: Iterable[str]) -> None:
+    keys = [(k,) for k in run_keys]
+    if keys:
+        for table in _JUDGE_SWARM_TABLES:
+            con.executemany(f"DELETE FROM {table} WHERE run_key=?", keys)
+
+
+def _canonical_entry_path(e: "os.DirEntry[str]") -> Path:
+    """
+    Canonical path of an entry of an already-resolved directory: only symlinks need
+    resolving (the entry type comes from the scan, so plain files cost no syscall).
+    """
+    p = Path(e.path)
+    return p.resolve() if e.is_symlink() else p
+
+
+# Union of the judge-swarm artifact globs (fnmatch `*` also matches newlines, hence DOTALL):
+#   webpipe-eval-judge-swarm-*.json, judge-swarm-*.json, tmp-eval-judge-swarm.json, tmp-live-swarm*.json
+_JUDGE_SWARM_NAME_RE = re.compile(
+    r"(?:webpipe-eval-judge-swarm-.*|judge-swarm-.*|tmp-eval-judge-swarm|tmp-live-swarm.*)\.json",
+    re.DOTALL,
+)
+
+
+# Rows per multi-row INSERT; capped so a statement never binds more than 999
+# parameters (the historical SQLITE_MAX_VARIABLE_NUMBER).
+_BULK_INSERT_ROWS = 100
+_BULK_INSERT_MAX_PARAMS = 999
+
+
+@functools.lru_cache(maxsize=64)
+def _multi_row_values_sql(prefix: str, width: int, k: int) -> str:
+    row = "(" + ", ".join(["?"] * width) + ")"
+    return prefix + " VALUES " + ", ".join([row] * k)
+
+
+def bulk_insert(
+    con: sqlite3.Connection, prefix: str, width: int, rows: list[tuple[Any, ...]], chunk: int = _BULK_INSERT_ROWS
+) -> None:
+    """
+    Insert `rows` (each `width` values) as `prefix VALUES (...), (...), ...` statements of up
+    to `chunk` rows: one statement step per chunk instead of per row. Rows keep their order.
+    """
+    chunk = max(1, min(chunk, _BULK_INSERT_MAX_PARAMS // width))
+    for i in range(0, len(rows), chunk):
+        part = rows[i : i + chunk]
+        con.execute(_multi_row_values_sql(prefix, width, len(part)), list(itertools.chain.from_iterable(part)))
+
+
+# Per-judge / per-trial / per-image rows go in with one executemany per artifact
+# (inside main()'s single ingest transaction).
+_JUDGE_SWARM_RUN_INSERT_SQL = """
+INSERT OR REPLACE INTO webpipe_eval_judge_swarm_runs(
+  run_key, generated_at_epoch_s, llm_backend, llm_model_effective, json_mode,
+  provider, auto_mode, selection_mode, fetch_backend, trial_set, max_queries, seed
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_JUDGE_META_INSERT_SQL = """
+INSERT OR REPLACE INTO webpipe_eval_judge_meta(
+  run_key, overall_assessment, cross_judge_agreement,
+  top_systemic_failures_json, top_systemic_failures_norm_json, top_systemic_failures_unknown_count,
+  top_3_fixes_json, recommended_next_experiments_json,
+  top_dimensions_json, top_musings_json
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_JUDGE_AGENT_REPORT_INSERT_SQL = """
+INSERT INTO webpipe_eval_judge_agent_reports(
+  run_key, judge_id,
+  totals_queries, totals_trials, totals_llm_ok, totals_llm_failed, totals_llm_parse_failed,
+  hit_expected_url_any_trial, overall_confidence,
+  top_failure_modes_json, top_failure_modes_norm_json, top_failure_modes_unknown_count
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# Trials are the highest-cardinality table: inserted with multi-row VALUES (bulk_insert).
+_JUDGE_TRIAL_INSERT_PREFIX = """
+INSERT INTO webpipe_eval_judge_trials(
+  run_key, judge_id, query_id, trial_id,
+  agentic, agentic_selector, fetch_backend, url_selection_mode,
+  elapsed_ms, ok, observed_url_count, warnings_count, judge_text_truncated,
+  judge_overall_score, judge_answerable, judge_relevant, judge_confidence,
+  judge_issues_json, judge_issues_norm_json, judge_issues_unknown_count,
+  hit_expected_url
+)"""
+_JUDGE_TRIAL_COLUMNS = 21
+_VLM_RUN_INSERT_SQL = """
+INSERT OR REPLACE INTO webpipe_eval_vlm_runs(
+  run_key, generated_at_epoch_s, model, temperature, trials, images,
+  totals_runs, totals_parsed_ok, goals_count, goal_profiles_json,
+  out_dir, transcript_jsonl,
+  transcript_events, transcript_vlm_events, transcript_vlm_schema_ok,
+  top_3_fixes_json
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_VLM_PER_INPUT_INSERT_SQL = """
+INSERT INTO webpipe_eval_vlm_per_input(
+  run_key, image_index, image_path, parsed_ok, score_0_10,
+  issues_count, p0_count, p1_count, p2_count,
+  consensus_fixes_json, top_3_fixes_json
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def parse_judge_swarm_file(path: Path, webpipe_root: Path) -> Optional[Dict[str, Any]]:
+    """
+    Read one judge-swarm artifact into webpipe_eval_judge_* rows. No DB access, so
+    artifacts can be parsed in worker processes.
+    Returns None if the file isn't a JSON object; otherwise {"kind", "schema_version",
+    "generated_at"} for its file record, plus "run_key", "run", "meta", "agents" and
+    "trials" rows when it is a judge-swarm run.
+    """
+    try:
+        obj = _load_json_file(path)
+    except Exception:
+        return None
+    if not isinstance(obj, dict):
+        return None
+    kind = safe_str(obj.get("kind"))
+    schema_version = safe_int(obj.get("schema_version"))
+    generated_at = safe_int(obj.get("generated_at_epoch_s"))
+
+    # Back-compat: some older artifacts omitted kind/schema_version.
+    # Infer from shape so historical runs remain analyzable.
+    inferred_judge_swarm = False
+    if kind is None:
+        if isinstance(obj.get("inputs"), dict) and isinstance(obj.get("judge_reports"), list):
+            inferred_judge_swarm = True
+            kind = "webpipe_eval_judge_swarm"
+    if schema_version is None and (kind == "webpipe_eval_judge_swarm" or inferred_judge_swarm):
+        schema_version = 1
+    out: Dict[str, Any] = {"kind": kind, "schema_version": schema_version, "generated_at": generated_at}
+    if kind != "webpipe_eval_judge_swarm":
+        return out
+
+    # run_key stable-ish: relative path under repo root
+    run_key = str(path.relative_to(webpipe_root))
+
+    inputs = dict_or_empty(obj, "inputs")
+    llm_backend = safe_str(inputs.get("llm_backend"))
+    llm_model_effective = safe_str(inputs.get("llm_model_effective"))
+    json_mode = safe_bool(inputs.get("json_mode"))
+    provider = safe_str(inputs.get("provider"))
+    auto_mode = safe_str(inputs.get("auto_mode"))
+    selection_mode = safe_str(inputs.get("selection_mode"))
+    fetch_backend = safe_str(inputs.get("fetch_backend"))
+    trial_set = safe_str(inputs.get("trial_set"))
+    max_queries = safe_int(inputs.get("max_queries"))
+    seed = safe_int(inputs.get("seed"))
+
+    run_row = (
+        run_key,
+        generated_at,
+        llm_backend,
+        llm_model_effective,
+        json_mode,
+        provider,
+        auto_mode,
+        selection_mode,
+        fetch_backend,
+        trial_set,
+        max_queries,
+        seed,
+    )
+
+    # Meta-judge summary (small, aggregatable fields).
+    meta = dict_or_empty(obj, "meta")
+    overall_assessment = safe_str(meta.get("overall_assessment"))
+    cross_judge_agreement = safe_str(meta.get("cross_judge_agreement"))
+    top_systemic_failures_json, top_systemic_failures_norm_json, top_systemic_failures_unknown_count = (
+        normalize_issue_list(meta.get("top_systemic_failures"))
+    )
+    top_3_fixes_json = json_str_list(meta.get("top_3_fixes"))
+    recommended_next_experiments_json = json_str_list(meta.get("recommended_next_experiments"))
+    top_dimensions_json = json_str_list(meta.get("top_dimensions"))
+    top_musings_json = json_str_list(meta.get("top_musings"))
+    meta_row = (
+        run_key,
+        overall_assessment,
+        cross_judge_agreement,
+        top_systemic_failures_json,
+        top_systemic_failures_norm_json,
+        top_systemic_failures_unknown_count,
+        top_3_fixes_json,
+        recommended_next_experiments_json,
+        top_dimensions_json,
+        top_musings_json,
+    )
+
+    agent_rows: list[tuple[Any, ...]] = []
+    trial_rows: list[tuple[Any, ...]] = []
+    _si, _sb, _ss = safe_int, safe_bool, safe_str
+    judge_reports = obj.get("judge_reports")
+    for jr in judge_reports if isinstance(judge_reports, list) else ():
+        if not isinstance(jr, dict):
+            continue
+        judge_id = safe_str(jr.get("judge_id"))
+        totals = dict_or_empty(jr, "totals")
+
+        totals_queries = safe_int(totals.get("queries"))
+        totals_trials = safe_int(totals.get("trials"))
+        totals_llm_ok = safe_int(totals.get("llm_ok"))
+        totals_llm_failed = safe_int(totals.get("llm_failed"))
+        totals_llm_parse_failed = safe_int(totals.get("llm_parse_failed"))
+        hit_expected = safe_int(totals.get("hit_expected_url_any_trial"))
+
+        overall = dict_or_empty(jr, "overall")
+        overall_conf = overall.get("confidence")
+        overall_confidence = float(overall_conf) if isinstance(overall_conf, (int, float)) else None
+
+        tfm = overall.get("top_failure_modes")
+        top_failure_modes_json, top_failure_modes_norm_json, top_failure_modes_unknown_count = (
+            normalize_issue_list(tfm)
+        )
+
+        agent_rows.append(
+            (
+                run_key,
+                judge_id,
+                totals_queries,
+                totals_trials,
+                totals_llm_ok,
+                totals_llm_failed,
+                totals_llm_parse_failed,
+                hit_expected,
+                overall_confidence,
+                top_failure_modes_json,
+                top_failure_modes_norm_json,
+                top_failure_modes_unknown_count,
+            )
+        )
+
+        # per_query → trials (store numeric + categorical only)
+        per_query = jr.get("per_query")
+        if not isinstance(per_query, list):
+            continue
+        for pq in per_query:
+            if not isinstance(pq, dict):
+                continue
+            query_id = safe_str(pq.get("query_id"))
+            trials = pq.get("trials")
+            if not isinstance(trials, list):
+                continue
+            for tr in trials:
+                if not isinstance(tr, dict):
+                    continue
+                # Hottest loop of the ingest: coercers and tr.get are bound to locals.
+                get = tr.get
+                trial_id = _ss(get("trial_id"))
+                agentic = _sb(get("agentic"))
+                agentic_selector = _ss(get("agentic_selector"))
+                tr_fetch_backend = _ss(get("fetch_backend"))
+                url_selection_mode = _ss(get("url_selection_mode"))
+                elapsed_ms = _si(get("elapsed_ms"))
+                ok = _sb(get("ok"))
+                observed_urls = get("observed_urls")
+                observed_url_count = len(observed_urls) if isinstance(observed_urls, list) else None
+                warnings = get("warnings")
+                warnings_count = len(warnings) if isinstance(warnings, list) else None
+                judge_text_truncated = _sb(get("judge_text_truncated"))
+                hit_expected_url = _sb(get("hit_expected_url"))
+
+                judge = dict_or_empty(tr, "judge")
+                judge_overall_score = None
+                v = judge.get("overall_score")
+                if isinstance(v, (int, float)):
+                    judge_overall_score = float(v)
+                judge_answerable = _sb(judge.get("answerable"))
+                judge_relevant = _sb(judge.get("relevant"))
+                vc = judge.get("confidence")
+                judge_confidence = float(vc) if isinstance(vc, (int, float)) else None
+                issues = judge.get("issues")
+                judge_issues_json, judge_issues_norm_json, judge_issues_unknown_count = (
+                    normalize_issue_list(issues)
+                )
+
+                trial_rows.append(
+                    (
+                        run_key,
+                        judge_id,
+                        query_id,
+                        trial_id,
+                        agentic,
+                        agentic_selector,
+                        tr_fetch_backend,
+                        url_selection_mode,
+                        elapsed_ms,
+                        ok,
+                        observed_url_count,
+                        warnings_count,
+                        judge_text_truncated,
+                        judge_overall_score,
+                        judge_answerable,
+                        judge_relevant,
+                        judge_confidence,
+                        judge_issues_json,
+                        judge_issues_norm_json,
+                        judge_issues_unknown_count,
+                        hit_expected_url,
+                    )
+                )
+
+    out.update(run_key=run_key, run=run_row, meta=meta_row, agents=agent_rows, trials=trial_rows)
+    return out
+
+
 def ingest_webpipe_eval_judge_swarm(con: sqlite3.Connection, webpipe_root: Path) -> int:
     """
     Ingest `.generated/webpipe-eval-judge-swarm-*.json` artifacts.
     Stores only configuration + numeric/judgment fields (no prose, no raw judge_text).
     Returns number of runs ingested.
+
+    Artifacts whose webpipe_eval_artifact_files row (from an earlier --incremental run)
+    matches their mtime, size and _EVAL_ARTIFACT_INGEST_VERSION are not re-read; runs
+    of artifacts that changed or disappeared are replaced or dropped.
+    Large ingests parse artifacts in a process pool; this process stays the only writer.
     """
-    gen_dir = webpipe_root / ".generated"
-    if not gen_dir.is_dir():
-        return 0
+    known: Dict[str, tuple[Optional[str], Optional[int], Optional[int], Optional[int]]] = {
+        path: (kind, mtime, size, version)
+        for path, kind, mtime, size, version in con.execute(
+            "SELECT path, kind, mtime_epoch_s, bytes, ingest_version FROM webpipe_eval_artifact_files"
+        )
+    }
+    stored_run_keys = {r[0] for r in con.execute("SELECT run_key FROM webpipe_eval_judge_swarm_runs")}
+    live_run_keys: set[str] = set()
 
-    # Judge-swarm artifacts have existed under a few filename conventions over time.
-    # Prefer explicit patterns first (bounded), then fall back to a shape-based scan.
-    paths: list[Path] = []
-    for pat in [
-        "webpipe-eval-judge-swarm-*.json",
-        "judge-swarm-*.json",
-        "tmp-eval-judge-swarm.json",
-        "tmp-live-swarm*.json",
-    ]:
-        paths.extend(gen_dir.glob(pat))
-    # De-dup, stable order.
-    paths = sorted({p.resolve() for p in paths})
+    # Judge-swarm artifacts have existed under a few filename conventions over time;
+    # one directory scan matches them all (see _JUDGE_SWARM_NAME_RE).
+    gen_dir = webpipe_root / ".generated"
+    found: set[Path] = set()
+    if gen_dir.is_dir():
+        gen_dir = gen_dir.resolve()
+        try:
+            with os.scandir(gen_dir) as it:
+                for e in it:
+                    if _JUDGE_SWARM_NAME_RE.fullmatch(e.name):
+                        found.add(_canonical_entry_path(e))
+        except OSError:
+            found = set()
+    # De-duped (symlinks), stable order.
+    paths = sorted(found)
+    seen: set[str] = set()  # paths whose file record is current
     runs = 0
+    jobs: list[tuple[Path, os.stat_result]] = []
     for p in paths:
         try:
-            obj = json.loads(p.read_text("utf-8"))
-        except Exception:
-            continue
-        if not isinstance(obj, dict):
-            continue
-        kind = safe_str(obj.get("kind"))
-        schema_version = safe_int(obj.get("schema_version"))
-        generated_at = safe_int(obj.get("generated_at_epoch_s"))
-
-        # Back-compat: some older artifacts omitted kind/schema_version.
-        # Infer from shape so historical runs remain analyzable.
-        inferred_judge_swarm = False
-        if kind is None:
-            if isinstance(obj.get("inputs"), dict) and isinstance(obj.get("judge_reports"), list):
-                inferred_judge_swarm = True
-                kind = "webpipe_eval_judge_swarm"
-        if schema_version is None and (kind == "webpipe_eval_judge_swarm" or inferred_judge_swarm):
-            schema_version = 1
-        _ingest_eval_file_record(con, p, kind, schema_version, generated_at)
-        if kind != "webpipe_eval_judge_swarm":
+            st = p.stat()
+        except OSError:
             continue
+        prev = known.get(str(p))
+        if prev is not None:
+            prev_kind, prev_mtime, prev_size, prev_version = prev
+            if (
+                prev_mtime == int(st.st_mtime)
+                and prev_size == int(st.st_size)
+                and prev_version == _EVAL_ARTIFACT_INGEST_VERSION
+            ):
+                if prev_kind != "webpipe_eval_judge_swarm":
+                    seen.add(str(p))
+                    continue
+                run_key = str(p.relative_to(webpipe_root))
+                if run_key in stored_run_keys:
+                    seen.add(str(p))
+                    live_run_keys.add(run_key)
+                    runs += 1
+                    continue
+        jobs.append((p, st))
 
-        # run_key stable-ish: relative path under repo root
-        run_key = str(p.relative_to(webpipe_root))
-
-        inputs = obj.get("inputs") if isinstance(obj.get("inputs"), dict) else {}
-        llm_backend = safe_str(inputs.get("llm_backend"))
-        llm_model_effective = safe_str(inputs.get("llm_model_effective"))
-        json_mode = safe_bool(inputs.get("json_mode"))
-        provider = safe_str(inputs.get("provider"))
-        auto_mode = safe_str(inputs.get("auto_mode"))
-        selection_mode = safe_str(inputs.get("selection_mode"))
-        fetch_backend = safe_str(inputs.get("fetch_backend"))
-        trial_set = safe_str(inputs.get("trial_set"))
-        max_queries = safe_int(inputs.get("max_queries"))
-        seed = safe_int(inputs.get("seed"))
-
-        con.execute(
-            """
-            INSERT OR REPLACE INTO webpipe_eval_judge_swarm_runs(
-              run_key, generated_at_epoch_s, llm_backend, llm_model_effective, json_mode,
-              provider, auto_mode, selection_mode, fetch_backend, trial_set, max_queries, seed
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                run_key,
-                generated_at,
-                llm_backend,
-                llm_model_effective,
-                json_mode,
-                provider,
-                auto_mode,
-                selection_mode,
-                fetch_backend,
-                trial_set,
-                max_queries,
-                seed,
-            ),
-        )
+    job_paths = [j[0] for j in jobs]
+    pool: Optional[ProcessPoolExecutor] = None
+    if len(jobs) > 1 and sum(j[1].st_size for j in jobs) >= _POOL_MIN_BYTES:
+        pool = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(jobs)))
+        results = pool.map(parse_judge_swarm_file, job_paths, itertools.repeat(webpipe_root), chunksize=4)
+    else:
+        results = map(parse_judge_swarm_file, job_paths, itertools.repeat(webpipe_root))
 
-        # Meta-judge summary (small, aggregatable fields).
-        meta = obj.get("meta") if isinstance(obj.get("meta"), dict) else {}
-        if isinstance(meta, dict):
-            overall_assessment = safe_str(meta.get("overall_assessment"))
-            cross_judge_agreement = safe_str(meta.get("cross_judge_agreement"))
-            top_systemic_failures_json, top_systemic_failures_norm_json, top_systemic_failures_unknown_count = (
-                normalize_issue_list(meta.get("top_systemic_failures"))
-            )
-            top_3_fixes_json = None
-            v = meta.get("top_3_fixes")
-            if isinstance(v, list) and all(isinstance(x, str) for x in v):
-                top_3_fixes_json = json.dumps(v, sort_keys=True)
-            recommended_next_experiments_json = None
-            v = meta.get("recommended_next_experiments")
-            if isinstance(v, list) and all(isinstance(x, str) for x in v):
-                recommended_next_experiments_json = json.dumps(v, sort_keys=True)
-            top_dimensions_json = None
-            v = meta.get("top_dimensions")
-            if isinstance(v, list) and all(isinstance(x, str) for x in v):
-                top_dimensions_json = json.dumps(v, sort_keys=True)
-            top_musings_json = None
-            v = meta.get("top_musings")
-            if isinstance(v, list) and all(isinstance(x, str) for x in v):
-                top_musings_json = json.dumps(v, sort_keys=True)
-            con.execute(
-                """
-                INSERT OR REPLACE INTO webpipe_eval_judge_meta(
-                  run_key, overall_assessment, cross_judge_agreement,
-                  top_systemic_failures_json, top_systemic_failures_norm_json, top_systemic_failures_unknown_count,
-                  top_3_fixes_json, recommended_next_experiments_json,
-                  top_dimensions_json, top_musings_json
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    run_key,
-                    overall_assessment,
-                    cross_judge_agreement,
-                    top_systemic_failures_json,
-                    top_systemic_failures_norm_json,
-                    top_systemic_failures_unknown_count,
-                    top_3_fixes_json,
-                    recommended_next_experiments_json,
-                    top_dimensions_json,
-                    top_musings_json,
-                ),
-            )
-
-        judge_reports = obj.get("judge_reports")
-        if not isinstance(judge_reports, list):
+    try:
+        for (p, st), parsed in zip(jobs, results):
+            if parsed is None:
+                continue
+            _ingest_eval_file_record(con, p, parsed["kind"], parsed["schema_version"], parsed["generated_at"], st)
+            seen.add(str(p))
+            if parsed["kind"] != "webpipe_eval_judge_swarm":
+                continue
+            run_key = parsed["run_key"]
+            live_run_keys.add(run_key)
+            if run_key in stored_run_keys:
+                # Changed since the last run: replace its rows (trials/reports are append-only inserts).
+                _delete_judge_swarm_runs(con, (run_key,))
+            con.execute(_JUDGE_SWARM_RUN_INSERT_SQL, parsed["run"])
+            con.execute(_JUDGE_META_INSERT_SQL, parsed["meta"])
+            con.executemany(_JUDGE_AGENT_REPORT_INSERT_SQL, parsed["agents"])
+            bulk_insert(con, _JUDGE_TRIAL_INSERT_PREFIX, _JUDGE_TRIAL_COLUMNS, parsed["trials"])
             runs += 1
-            continue
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
 
-        for jr in judge_reports:
-            if not isinstance(jr, dict):
-                continue
-            judge_id = safe_str(jr.get("judge_id"))
-            totals = jr.get("totals") if isinstance(jr.get("totals"), dict) else {}
-
-            totals_queries = safe_int(totals.get("queries"))
-            totals_trials = safe_int(totals.get("trials"))
-            totals_llm_ok = safe_int(totals.get("llm_ok"))
-            totals_llm_failed = safe_int(totals.get("llm_failed"))
-            totals_llm_parse_failed = safe_int(totals.get("llm_parse_failed"))
-            hit_expected = safe_int(totals.get("hit_expected_url_any_trial"))
-
-            overall = jr.get("overall") if isinstance(jr.get("overall"), dict) else {}
-            overall_conf = overall.get("confidence")
-            overall_confidence = float(overall_conf) if isinstance(overall_conf, (int, float)) else None
-
-            tfm = overall.get("top_failure_modes")
-            top_failure_modes_json, top_failure_modes_norm_json, top_failure_modes_unknown_count = (
-                normalize_issue_list(tfm)
-            )
+    _delete_judge_swarm_runs(con, stored_run_keys - live_run_keys)
+    gone = [(path,) for path in known if path not in seen]
+    if gone:
+        con.executemany("DELETE FROM webpipe_eval_artifact_files WHERE path=?", gone)
+    return runs
 
-            con.execute(
-                """
-                INSERT INTO webpipe_eval_judge_agent_reports(
-                  run_key, judge_id,
-                  totals_queries, totals_trials, totals_llm_ok, totals_llm_failed, totals_llm_parse_failed,
-                  hit_expected_url_any_trial, overall_confidence,
-                  top_failure_modes_json, top_failure_modes_norm_json, top_failure_modes_unknown_count
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    run_key,
-                    judge_id,
-                    totals_queries,
-                    totals_trials,
-                    totals_llm_ok,
-                    totals_llm_failed,
-                    totals_llm_parse_failed,
-                    hit_expected,
-                    overall_confidence,
-                    top_failure_modes_json,
-                    top_failure_modes_norm_json,
-                    top_failure_modes_unknown_count,
-                ),
-            )
 
-            # per_query → trials (store numeric + categorical only)
-            per_query = jr.get("per_query")
-            if not isinstance(per_query, list):
-                continue
-            for pq in per_query:
-                if not isinstance(pq, dict):
-                    continue
-                query_id = safe_str(pq.get("query_id"))
-                trials = pq.get("trials")
-                if not isinstance(trials, list):
-                    continue
-                for tr in trials:
-                    if not isinstance(tr, dict):
+def _iter_binary_lines(path: Path) -> Iterator[bytes]:
+    """Lines of `path` as bytes; large files are read through mmap instead of a buffered reader."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size >= _MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield from iter(mm.readline, b"")
+        else:
+            yield from f
+
+
+# Equivalent of the globs `webpipe-eval-vlm-run-*/summary.json` (directory part) and
+# `webpipe-eval-vlm-*.json` (which subsumes `webpipe-eval-vlm-run-*.json`).
+_VLM_RUN_DIR_RE = re.compile(r"webpipe-eval-vlm-run-.*", re.DOTALL)
+_VLM_FLAT_NAME_RE = re.compile(r"webpipe-eval-vlm-.*\.json", re.DOTALL)
+
+
+def parse_vlm_run_file(path: Path, webpipe_root: Path) -> Optional[tuple[tuple[Any, ...], list[tuple[Any, ...]]]]:
+    """
+    Read one VLM run summary (and count its transcript) into a webpipe_eval_vlm_runs row
+    plus webpipe_eval_vlm_per_input rows. None if it isn't a v1 `webpipe_eval_vlm_run`.
+    No DB access, so summaries can be parsed in worker processes.
+    """
+    try:
+        obj = _load_json_file(path)
+    except Exception:
+        return None
+    if not isinstance(obj, dict):
+        return None
+    if safe_str(obj.get("kind")) != "webpipe_eval_vlm_run":
+        return None
+    sv = safe_int(obj.get("schema_version"))
+    if sv is not None and sv != 1:
+        return None
+
+    generated_at = safe_int(obj.get("generated_at_epoch_s"))
+    run_key = str(path.relative_to(webpipe_root))
+
+    inputs = dict_or_empty(obj, "inputs")
+    totals = dict_or_empty(obj, "totals")
+    outputs = dict_or_empty(obj, "outputs")
+
+    model = safe_str(inputs.get("model"))
+    temperature = inputs.get("temperature")
+    temperature_f = float(temperature) if isinstance(temperature, (int, float)) else None
+    trials = safe_int(inputs.get("trials"))
+    images = safe_int(totals.get("images"))
+    totals_runs = safe_int(totals.get("runs"))
+    totals_parsed_ok = safe_int(totals.get("parsed_ok"))
+
+    goals = inputs.get("goals")
+    goals_count = len(goals) if isinstance(goals, list) else None
+    gp = inputs.get("goal_profiles")
+    goal_profiles_json = None
+    if isinstance(gp, list) and all(isinstance(x, str) for x in gp):
+        goal_profiles_json = dump_str_list(tuple(gp))
+
+    out_dir = safe_str(outputs.get("out_dir"))
+    transcript_jsonl = safe_str(outputs.get("transcript_jsonl"))
+    transcript_events = None
+    transcript_vlm_events = None
+    transcript_vlm_schema_ok = None
+
+    # If the transcript exists, compute a few cheap, aggregatable counts.
+    if isinstance(transcript_jsonl, str) and transcript_jsonl.strip():
+        tp = Path(transcript_jsonl)
+        if not tp.is_absolute():
+            tp = (webpipe_root / tp).resolve()
+        if tp.is_file():
+            total = 0
+            vlm = 0
+            vlm_ok = 0
+            try:
+                for raw_line in _iter_universal_lines(_iter_binary_lines(tp)):
+                    # Only VLM transcript events are inspected: skip the parse for any
+                    # line that lacks both literals (serializers don't escape them).
+                    if b'"vlm_openrouter"' not in raw_line or b'"webpipe_eval_transcript_event"' not in raw_line:
+                        # Still counted when non-blank; decode only if the first
+                        # non-space byte isn't printable ASCII.
+                        head = raw_line.lstrip()[:1]
+                        if head and (b"!" <= head <= b"~" or raw_line.decode("utf-8", errors="ignore").strip()):
+                            total += 1
                         continue
-                    trial_id = safe_str(tr.get("trial_id"))
-                    agentic = safe_bool(tr.get("agentic"))
-                    agentic_selector = safe_str(tr.get("agentic_selector"))
-                    tr_fetch_backend = safe_str(tr.get("fetch_backend"))
-                    url_selection_mode = safe_str(tr.get("url_selection_mode"))
-                    elapsed_ms = safe_int(tr.get("elapsed_ms"))
-                    ok = safe_bool(tr.get("ok"))
-                    observed_urls = tr.get("observed_urls")
-                    observed_url_count = len(observed_urls) if isinstance(observed_urls, list) else None
-                    warnings = tr.get("warnings")
-                    warnings_count = len(warnings) if isinstance(warnings, list) else None
-                    judge_text_truncated = safe_bool(tr.get("judge_text_truncated"))
-                    hit_expected_url = safe_bool(tr.get("hit_expected_url"))
-
-                    judge = tr.get("judge") if isinstance(tr.get("judge"), dict) else {}
-                    judge_overall_score = None
-                    v = judge.get("overall_score")
-                    if isinstance(v, (int, float)):
-                        judge_overall_score = float(v)
-                    judge_answerable = safe_bool(judge.get("answerable"))
-                    judge_relevant = safe_bool(judge.get("relevant"))
-                    vc = judge.get("confidence")
-                    judge_confidence = float(vc) if isinstance(vc, (int, float)) else None
-                    issues = judge.get("issues")
-                    judge_issues_json, judge_issues_norm_json, judge_issues_unknown_count = (
-                        normalize_issue_list(issues)
-                    )
+                    # Same fast path as parse_transcript_file: parse the bytes, and only
+                    # decode (dropping invalid bytes) + strip lines that fail.
+                    try:
+                        ev = _json_loads(raw_line)
+                    except Exception:
+                        line = raw_line.decode("utf-8", errors="ignore").strip()
+                        if not line:
+                            continue
+                        total += 1
+                        try:
+                            ev = _json_loads(line)
+                        except Exception:
+                            continue
+                    else:
+                        total += 1
+                    if not isinstance(ev, dict):
+                        continue
+                    if ev.get("kind") != "webpipe_eval_transcript_event":
+                        continue
+                    if safe_str(ev.get("stage")) != "vlm_openrouter":
+                        continue
+                    vlm += 1
+                    resp = ev.get("response")
+                    if not isinstance(resp, dict):
+                        resp = None
+                    parsed = resp.get("parsed") if resp else None
+                    if schema_ok_for_stage("vlm_openrouter", parsed) == 1:
+                        vlm_ok += 1
+            except OSError:
+                pass
+            transcript_events = total
+            transcript_vlm_events = vlm
+            transcript_vlm_schema_ok = vlm_ok
+
+    top_3_fixes_json = json_str_list(obj.get("top_3_fixes"))
+
+    run_row = (
+        run_key,
+        generated_at,
+        model,
+        temperature_f,
+        trials,
+        images,
+        totals_runs,
+        totals_parsed_ok,
+        goals_count,
+        goal_profiles_json,
+        out_dir,
+        transcript_jsonl,
+        transcript_events,
+        transcript_vlm_events,
+        transcript_vlm_schema_ok,
+        top_3_fixes_json,
+    )
 
-                    con.execute(
-                        """
-                        INSERT INTO webpipe_eval_judge_trials(
-                          run_key, judge_id, query_id, trial_id,
-                          agentic, agentic_selector, fetch_backend, url_selection_mode,
-                          elapsed_ms, ok, observed_url_count, warnings_count, judge_text_truncated,
-                          judge_overall_score, judge_answerable, judge_relevant, judge_confidence,
-                          judge_issues_json, judge_issues_norm_json, judge_issues_unknown_count,
-                          hit_expected_url
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        """,
-                        (
-                            run_key,
-                            judge_id,
-                            query_id,
-                            trial_id,
-                            agentic,
-                            agentic_selector,
-                            tr_fetch_backend,
-                            url_selection_mode,
-                            elapsed_ms,
-                            ok,
-                            observed_url_count,
-                            warnings_count,
-                            judge_text_truncated,
-                            judge_overall_score,
-                            judge_answerable,
-                            judge_relevant,
-                            judge_confidence,
-                            judge_issues_json,
-                            judge_issues_norm_json,
-                            judge_issues_unknown_count,
-                            hit_expected_url,
-                        ),
-                    )
+    per_input_rows: list[tuple[Any, ...]] = []
+    per_input = obj.get("per_input")
+    if isinstance(per_input, list):
+        for it in per_input:
+            if not isinstance(it, dict):
+                continue
+            image_index = safe_int(it.get("image_index"))
+            image_path = safe_str(it.get("image_path"))
+            parsed_ok = safe_bool(it.get("parsed_ok"))
+            score_0_10 = None
+            s = it.get("score_0_10")
+            if isinstance(s, (int, float)):
+                score_0_10 = float(s)
+            issues = it.get("issues")
+            issues_count = len(issues) if isinstance(issues, list) else None
+
+            p0, p1, p2 = count_severities(issues) if isinstance(issues, list) else (0, 0, 0)
+
+            consensus_fixes_json = None
+            trials_obj = it.get("trials")
+            if isinstance(trials_obj, dict):
+                consensus_fixes_json = json_str_list(trials_obj.get("consensus_fixes"))
+
+            top_3_fixes_json2 = json_str_list(it.get("top_3_fixes"))
+
+            per_input_rows.append(
+                (
+                    run_key,
+                    image_index,
+                    image_path,
+                    parsed_ok,
+                    score_0_10,
+                    issues_count,
+                    p0,
+                    p1,
+                    p2,
+                    consensus_fixes_json,
+                    top_3_fixes_json2,
+                )
+            )
 
-        runs += 1
-    return runs
+    return run_row, per_input_rows
 
 
 def ingest_webpipe_eval_vlm_runs(con: sqlite3.Connection, webpipe_root: Path) -> int:
     """
     Ingest `.generated/**` VLM run summaries produced by `webpipe eval-vlm-run`.
     Returns number of run summaries ingested.
+    Large ingests parse summaries in a process pool; this process stays the only writer.
     """
     gen_dir = webpipe_root / ".generated"
     if not gen_dir.is_dir():
         return 0
+    gen_dir = gen_dir.resolve()
 
     # Filename conventions:
     # - default: .generated/webpipe-eval-vlm-run-<epoch>/summary.json
     # - some callers may write a flat file; accept both.
+    # One directory scan covers the old globs (see _VLM_RUN_DIR_RE / _VLM_FLAT_NAME_RE).
     paths: list[Path] = []
-    for pat in [
-        "webpipe-eval-vlm-run-*/summary.json",
-        "webpipe-eval-vlm-run-*.json",
-        "webpipe-eval-vlm-*.json",
-    ]:
-        paths.extend(gen_dir.glob(pat))
-    paths = sorted({p.resolve() for p in paths})
+    try:
+        with os.scandir(gen_dir) as it:
+            for e in it:
+                if _VLM_FLAT_NAME_RE.fullmatch(e.name):
+                    paths.append(_canonical_entry_path(e))
+                if _VLM_RUN_DIR_RE.fullmatch(e.name):
+                    try:
+                        if not e.is_dir():
+                            continue
+                    except OSError:
+                        continue
+                    summary = Path(e.path) / "summary.json"
+                    if summary.exists():
+                        if e.is_symlink() or summary.is_symlink():
+                            summary = summary.resolve()
+                        paths.append(summary)
+    except OSError:
+        return 0
+    # De-dup (symlinks), stable order.
+    paths = sorted(set(paths))
 
-    runs = 0
+    # Summary sizes only: the transcripts each one counts are found while parsing it.
+    sizes: list[int] = []
     for p in paths:
         try:
-            obj = json.loads(p.read_text("utf-8"))
-        except Exception:
-            continue
-        if not isinstance(obj, dict):
-            continue
-        if safe_str(obj.get("kind")) != "webpipe_eval_vlm_run":
-            continue
-        sv = safe_int(obj.get("schema_version"))
-        if sv is not None and sv != 1:
-            continue
-
-        generated_at = safe_int(obj.get("generated_at_epoch_s"))
-        run_key = str(p.relative_to(webpipe_root))
-
-        inputs = obj.get("inputs") if isinstance(obj.get("inputs"), dict) else {}
-        totals = obj.get("totals") if isinstance(obj.get("totals"), dict) else {}
-        outputs = obj.get("outputs") if isinstance(obj.get("outputs"), dict) else {}
-
-        model = safe_str(inputs.get("model"))
-        temperature = inputs.get("temperature")
-        temperature_f = float(temperature) if isinstance(temperature, (int, float)) else None
-        trials = safe_int(inputs.get("trials"))
-        images = safe_int(totals.get("images"))
-        totals_runs = safe_int(totals.get("runs"))
-        totals_parsed_ok = safe_int(totals.get("parsed_ok"))
-
-        goals = inputs.get("goals")
-        goals_count = len(goals) if isinstance(goals, list) else None
-        gp = inputs.get("goal_profiles")
-        goal_profiles_json = None
-        if isinstance(gp, list) and all(isinstance(x, str) for x in gp):
-            goal_profiles_json = json.dumps(gp, sort_keys=True)
-
-        out_dir = safe_str(outputs.get("out_dir"))
-        transcript_jsonl = safe_str(outputs.get("transcript_jsonl"))
-        transcript_events = None
-        transcript_vlm_events = None
-        transcript_vlm_schema_ok = None
-
-        # If the transcript exists, compute a few cheap, aggregatable counts.
-        if isinstance(transcript_jsonl, str) and transcript_jsonl.strip():
-            tp = Path(transcript_jsonl)
-            if not tp.is_absolute():
-                tp = (webpipe_root / tp).resolve()
-            if tp.is_file():
-                total = 0
-                vlm = 0
-                vlm_ok = 0
-                try:
-                    with tp.open("r", encoding="utf-8", errors="ignore") as f:
-                        for line in f:
-                            line = line.strip()
-                            if not line:
-                                continue
-                            total += 1
-                            try:
-                                ev = json.loads(line)
-                            except Exception:
-                                continue
-                            if not isinstance(ev, dict):
-                                continue
-                            if ev.get("kind") != "webpipe_eval_transcript_event":
-                                continue
-                            if safe_str(ev.get("stage")) != "vlm_openrouter":
-                                continue
-                            vlm += 1
-                            resp = ev.get("response") if isinstance(ev.get("response"), dict) else None
-                            parsed = resp.get("parsed") if resp else None
-                            if schema_ok_for_stage("vlm_openrouter", parsed) == 1:
-                                vlm_ok += 1
-                except OSError:
-                    pass
-                transcript_events = total
-                transcript_vlm_events = vlm
-                transcript_vlm_schema_ok = vlm_ok
-
-        t3 = obj.get("top_3_fixes")
-        top_3_fixes_json = None
-        if isinstance(t3, list) and all(isinstance(x, str) for x in t3):
-            top_3_fixes_json = json.dumps(t3, sort_keys=True)
-
-        _ingest_eval_file_record(con, p, "webpipe_eval_vlm_run", 1, generated_at)
-
-        con.execute(
-            """
-            INSERT OR REPLACE INTO webpipe_eval_vlm_runs(
-              run_key, generated_at_epoch_s, model, temperature, trials, images,
-              totals_runs, totals_parsed_ok, goals_count, goal_profiles_json,
-              out_dir, transcript_jsonl,
-              transcript_events, transcript_vlm_events, transcript_vlm_schema_ok,
-              top_3_fixes_json
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                run_key,
-                generated_at,
-                model,
-                temperature_f,
-                trials,
-                images,
-                totals_runs,
-                totals_parsed_ok,
-                goals_count,
-                goal_profiles_json,
-                out_dir,
-                transcript_jsonl,
-                transcript_events,
-                transcript_vlm_events,
-                transcript_vlm_schema_ok,
-                top_3_fixes_json,
-            ),
-        )
-
-        per_input = obj.get("per_input")
-        if isinstance(per_input, list):
-            for it in per_input:
-                if not isinstance(it, dict):
-                    continue
-                image_index = safe_int(it.get("image_index"))
-                image_path = safe_str(it.get("image_path"))
-                parsed_ok = safe_bool(it.get("parsed_ok"))
-                score_0_10 = None
-                s = it.get("score_0_10")
-                if isinstance(s, (int, float)):
-                    score_0_10 = float(s)
-                issues = it.get("issues")
-                issues_count = len(issues) if isinstance(issues, list) else None
-
-                p0 = p1 = p2 = 0
-                if isinstance(issues, list):
-                    for iss in issues:
-                        if not isinstance(iss, dict):
-                            continue
-                        sev = iss.get("severity")
-                        if not isinstance(sev, str):
-                            continue
-                        ss = sev.strip().upper()
-                        if ss == "P0":
-                            p0 += 1
-                        elif ss == "P1":
-                            p1 += 1
-                        elif ss == "P2":
-                            p2 += 1
-
-                consensus_fixes_json = None
-                trials_obj = it.get("trials")
-                if isinstance(trials_obj, dict):
-                    cf = trials_obj.get("consensus_fixes")
-                    if isinstance(cf, list) and all(isinstance(x, str) for x in cf):
-                        consensus_fixes_json = json.dumps(cf, sort_keys=True)
-
-                top_3_fixes_json2 = None
-                t3i = it.get("top_3_fixes")
-                if isinstance(t3i, list) and all(isinstance(x, str) for x in t3i):
-                    top_3_fixes_json2 = json.dumps(t3i, sort_keys=True)
-
-                con.execute(
-                    """
-                    INSERT INTO webpipe_eval_vlm_per_input(
-                      run_key, image_index, image_path, parsed_ok, score_0_10,
-                      issues_count, p0_count, p1_count, p2_count,
-                      consensus_fixes_json, top_3_fixes_json
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        run_key,
-                        image_index,
-                        image_path,
-                        parsed_ok,
-                        score_0_10,
-                        issues_count,
-                        p0,
-                        p1,
-                        p2,
-                        consensus_fixes_json,
-                        top_3_fixes_json2,
-                    ),
-                )
+            sizes.append(p.stat().st_size)
+        except OSError:
+            sizes.append(0)
+    pool: Optional[ProcessPoolExecutor] = None
+    if len(paths) > 1 and sum(sizes) >= _POOL_MIN_BYTES:
+        pool = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(paths)))
+        results = pool.map(parse_vlm_run_file, paths, itertools.repeat(webpipe_root), chunksize=4)
+    else:
+        results = map(parse_vlm_run_file, paths, itertools.repeat(webpipe_root))
 
-        runs += 1
+    runs = 0
+    try:
+        for p, parsed in zip(paths, results):
+            if parsed is None:
+                continue
+            run_row, per_input_rows = parsed
+            _ingest_eval_file_record(con, p, "webpipe_eval_vlm_run", 1, run_row[1])  # generated_at_epoch_s
+            con.execute(_VLM_RUN_INSERT_SQL, run_row)
+            con.executemany(_VLM_PER_INPUT_INSERT_SQL, per_input_rows)
+            runs += 1
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
 
     return runs
 
@@ -1981,6 +2672,11 @@ def main() -> None:
         default=None,
         help="Optional: restrict report aggregation to transcript events whose src_path contains this substring.",
     )
+    ap.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse an existing --out DB: only re-read transcripts and judge-swarm artifacts that changed since the last run.",
+    )
     args = ap.parse_args()
 
     include_prefixes = args.include_prefix or ["web_", "tavily", "firecrawl", "brave"]
@@ -1991,12 +2687,14 @@ def main() -> None:
 
     out = args.out
     ensure_parent_dir(out)
-    if out.exists():
+    if out.exists() and not args.incremental:
         out.unlink()
 
-    con = sql_connect(out)
+    con = sql_connect(out, bulk_load=True, scratch=not args.incremental)
     try:
         sql_init(con)
+        if args.incremental:
+            sql_reset_rebuilt_tables(con)
         upsert_meta(con, "generated_at_utc", utc_now_iso())
         upsert_meta(con, "webpipe_root", str(args.webpipe_root))
         upsert_meta(con, "chatvault_bin", str(args.chatvault_bin))
@@ -2019,14 +2717,37 @@ def main() -> None:
 
         vlm_runs = ingest_webpipe_eval_vlm_runs(con, args.webpipe_root)
         upsert_meta(con, "webpipe_eval_vlm_runs_ingested", str(vlm_runs))
+        sql_init_indexes(con)
+        # Reports are independent read-only scans: commit the ingest, build them in
+        # parallel on their own read-only connections, then store/write them here.
+        con.commit()
+        src = args.report_src_substring
+        reports: list[tuple[Path, Callable[[sqlite3.Connection], Dict[str, Any]]]] = []
         if args.vlm_report_out is not None:
-            emit_vlm_report(con, args.vlm_report_out)
+            reports.append((args.vlm_report_out, build_vlm_report))
         if args.critic_report_out is not None:
-            emit_critic_report(con, args.critic_report_out, src_path_substring=args.report_src_substring)
+            reports.append((args.critic_report_out, functools.partial(build_critic_report, src_path_substring=src)))
         if args.judge_musings_report_out is not None:
-            emit_judge_musings_report(con, args.judge_musings_report_out, src_path_substring=args.report_src_substring)
+            reports.append(
+                (args.judge_musings_report_out, functools.partial(build_judge_musings_report, src_path_substring=src))
+            )
         if args.judge_context_report_out is not None:
-            emit_judge_context_report(con, args.judge_context_report_out, src_path_substring=args.report_src_substring)
+            reports.append(
+                (args.judge_context_report_out, functools.partial(build_judge_context_report, src_path_substring=src))
+            )
+
+        def build(report: tuple[Path, Callable[[sqlite3.Connection], Dict[str, Any]]]) -> Dict[str, Any]:
+            ro = sql_connect_ro(out)
+            try:
+                return report[1](ro)
+            finally:
+                ro.close()
+
+        if reports:
+            with ThreadPoolExecutor(max_workers=len(reports)) as ex:
+                payloads = list(ex.map(build, reports))
+            for (report_out, _), payload in zip(reports, payloads):
+                write_report(con, report_out, payload)
 
         con.commit()
     finally:
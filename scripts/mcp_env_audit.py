@@ -52,7 +52,7 @@ def env_keys(server: dict[str, Any]) -> list[str]:
     return keys
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Row:
     name: str
     kind: str
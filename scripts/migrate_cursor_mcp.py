@@ -12,15 +12,19 @@ from __future__ import annotations
 
 import json
 import os
-import shutil
 import sys
+import time
 import argparse
 import re
 from dataclasses import dataclass
-from datetime import datetime
 from pathlib import Path
 from typing import Any, NoReturn
 
+try:  # Optional: orjson parses backups faster; stdlib json is the fallback.
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 
 def fail(msg: str) -> NoReturn:
     print(msg, file=sys.stderr)
@@ -40,7 +44,8 @@ def default_paths() -> Paths:
     home = Path.home()
     mcp_json = home / ".cursor" / "mcp.json"
 
-    workspace_root = Path(os.environ.get("WEBPIPE_WORKSPACE_ROOT", Path.cwd()))
+    env_root = os.environ.get("WEBPIPE_WORKSPACE_ROOT")
+    workspace_root = Path(env_root) if env_root is not None else Path.cwd()
     webpipe_manifest = workspace_root / "webpipe" / "crates" / "webpipe-mcp" / "Cargo.toml"
     webpipe_bin = workspace_root / "webpipe" / "target" / "release" / "webpipe"
     cache_dir = workspace_root / "_scratch" / "webpipe-cache"
@@ -54,26 +59,99 @@ def default_paths() -> Paths:
     )
 
 
+def _json_loads(raw: bytes) -> Any:
+    """Parse UTF-8 JSON bytes; same results (and errors) as json.loads(raw.decode("utf-8"))."""
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (NaN/Infinity, lone surrogates): let stdlib decide.
+            pass
+    return json.loads(raw.decode("utf-8"))
+
+
 def load_json(path: Path) -> dict[str, Any]:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return _json_loads(path.read_bytes())
     except FileNotFoundError:
         fail(f"missing Cursor MCP config at: {path}")
     except json.JSONDecodeError as e:
         fail(f"invalid JSON in {path}: {e}")
 
 
+# Linux FICLONE ioctl: the destination shares the source's extents copy-on-write
+# (btrfs, XFS, bcachefs, ...), so no bytes are copied.
+_FICLONE = 0x40049409
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+
+    try:
+        with open(src, "rb") as fs, open(dst, "wb") as fd:
+            fcntl.ioctl(fd.fileno(), _FICLONE, fs.fileno())
+    except OSError:
+        return False
+    return True
+
+
 def atomic_backup(path: Path) -> Path:
-    ts = datetime.now().strftime("%Y%m%d-%H%M%S")
+    import shutil  # local: only needed when writing (not for --help / --dry-run)
+
+    ts = time.strftime("%Y%m%d-%H%M%S")
     backup = path.with_suffix(path.suffix + f".bak-{ts}")
-    shutil.copy2(path, backup)
+    # Two runs within the same second must not clobber the first backup; numbered
+    # suffixes still sort newest-first for --copy-mcp-backups discovery.
+    n = 0
+    while backup.exists():
+        n += 1
+        backup = path.with_suffix(path.suffix + f".bak-{ts}-{n}")
+    # Reflink where the filesystem supports it, else a byte copy. Not a hardlink: Cursor
+    # (or an editor) may rewrite mcp.json in place, which would change the backup too.
+    if _reflink(path, backup):
+        shutil.copystat(path, backup)
+    else:
+        shutil.copy2(path, backup)
     return backup
 
 
+def _fsync_dir(path: Path) -> None:
+    # Best-effort: directories can't be opened for fsync on every platform (e.g. Windows).
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
 def write_json(path: Path, data: dict) -> None:
+    """
+    Replace `path` atomically and durably: the temp file's content is fsync'd before the
+    rename, and the directory after it, so a crash leaves either the old or new config.
+    The temp file is read back and checked against the payload's SHA-256 first; on a
+    mismatch the original is left untouched.
+    """
+    import hashlib  # local: only needed when writing (not for --help / --dry-run)
+
     tmp = path.with_suffix(path.suffix + ".tmp")
-    tmp.write_text(json.dumps(data, indent=2, sort_keys=False) + "\n", encoding="utf-8")
-    tmp.replace(path)
+    payload = (json.dumps(data, indent=2, sort_keys=False) + "\n").encode("utf-8")
+    want = hashlib.sha256(payload).digest()
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    if hashlib.sha256(tmp.read_bytes()).digest() != want:
+        tmp.unlink(missing_ok=True)
+        fail(f"write verification failed for {tmp}; {path} was not modified")
+    os.replace(tmp, path)
+    _fsync_dir(path.parent)
 
 
 def ensure_webpipe_server(cfg: dict, paths: Paths, *, launch_mode: str) -> None:
@@ -114,22 +192,36 @@ def ensure_webpipe_server(cfg: dict, paths: Paths, *, launch_mode: str) -> None:
     cfg["mcpServers"]["webpipe"] = webpipe_entry
 
 
-def maybe_copy_env_keys(cfg: dict[str, Any], *, copy_keys: bool) -> list[str]:
-    if not copy_keys:
-        return []
-
+def _webpipe_env(cfg: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    The webpipe server's env block in `cfg` (missing levels are created empty), for the
+    key-copy helpers to mutate in place. None if a level isn't an object.
+    """
     servers = cfg.get("mcpServers") or {}
     if not isinstance(servers, dict):
-        return []
-
-    copied: list[str] = []
-
+        return None
     webpipe = servers.get("webpipe") or {}
     if not isinstance(webpipe, dict):
-        return []
+        return None
     webpipe_env = webpipe.get("env") or {}
     if not isinstance(webpipe_env, dict):
+        return None
+    webpipe["env"] = webpipe_env
+    servers["webpipe"] = webpipe
+    cfg["mcpServers"] = servers
+    return webpipe_env
+
+
+def maybe_copy_env_keys(cfg: dict[str, Any], *, copy_keys: bool) -> list[str]:
+    if not copy_keys:
+        return []
+
+    webpipe_env = _webpipe_env(cfg)
+    if webpipe_env is None:
         return []
+    servers = cfg["mcpServers"]
+
+    copied: set[str] = set()
 
     def copy_from(server_name: str, src_key: str, dst_key: str) -> None:
         nonlocal copied
@@ -142,18 +234,25 @@ def maybe_copy_env_keys(cfg: dict[str, Any], *, copy_keys: bool) -> list[str]:
         v = env.get(src_key)
         if isinstance(v, str) and v:
             webpipe_env[dst_key] = v
-            copied.append(dst_key)
+            copied.add(dst_key)
 
     # Reuse existing values already in your Cursor MCP config.
     copy_from("tavily-remote-mcp", "TAVILY_API_KEY", "WEBPIPE_TAVILY_API_KEY")
     copy_from("firecrawl-mcp", "FIRECRAWL_API_KEY", "WEBPIPE_FIRECRAWL_API_KEY")
+    return sorted(copied)
 
-    # Write env back (mutated in place).
-    webpipe["env"] = webpipe_env
-    servers["webpipe"] = webpipe
-    cfg["mcpServers"] = servers
-    return copied
 
+# Source key -> destination key in webpipe env, as (src, dst) pairs. Order matters:
+# without --overwrite the first source found for a destination wins, with it the last.
+_KEY_SOURCES: tuple[tuple[str, str], ...] = (
+    ("TAVILY_API_KEY", "WEBPIPE_TAVILY_API_KEY"),
+    ("FIRECRAWL_API_KEY", "WEBPIPE_FIRECRAWL_API_KEY"),
+    ("BRAVE_SEARCH_API_KEY", "WEBPIPE_BRAVE_API_KEY"),
+    ("WEBPIPE_TAVILY_API_KEY", "WEBPIPE_TAVILY_API_KEY"),
+    ("WEBPIPE_FIRECRAWL_API_KEY", "WEBPIPE_FIRECRAWL_API_KEY"),
+    ("WEBPIPE_BRAVE_API_KEY", "WEBPIPE_BRAVE_API_KEY"),
+)
+_TARGET_KEYS = frozenset(dst for _, dst in _KEY_SOURCES)
 
 _ENV_ASSIGN_RE = re.compile(r"^\s*(?:export\s+)?([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*)\s*$")
 
@@ -197,42 +296,24 @@ def maybe_copy_keys_from_env_files(
     Copy a small allowlist of keys from repo .env files into webpipe's env block.
     Never prints values.
     """
-    servers = cfg.get("mcpServers") or {}
-    if not isinstance(servers, dict):
-        return []
-    webpipe = servers.get("webpipe") or {}
-    if not isinstance(webpipe, dict):
-        return []
-    webpipe_env = webpipe.get("env") or {}
-    if not isinstance(webpipe_env, dict):
+    webpipe_env = _webpipe_env(cfg)
+    if webpipe_env is None:
         return []
 
-    # Source key -> destination key in webpipe env
-    mapping = {
-        "TAVILY_API_KEY": "WEBPIPE_TAVILY_API_KEY",
-        "FIRECRAWL_API_KEY": "WEBPIPE_FIRECRAWL_API_KEY",
-        "BRAVE_SEARCH_API_KEY": "WEBPIPE_BRAVE_API_KEY",
-        "WEBPIPE_TAVILY_API_KEY": "WEBPIPE_TAVILY_API_KEY",
-        "WEBPIPE_FIRECRAWL_API_KEY": "WEBPIPE_FIRECRAWL_API_KEY",
-        "WEBPIPE_BRAVE_API_KEY": "WEBPIPE_BRAVE_API_KEY",
-    }
-
-    copied: list[str] = []
+    copied: set[str] = set()
     for p in env_files:
+        if not overwrite and _TARGET_KEYS.issubset(webpipe_env.keys()):
+            break  # nothing left to fill in; skip reading the remaining files
         kv = _parse_env_file_no_print(p)
-        for src, dst in mapping.items():
+        for src, dst in _KEY_SOURCES:
             v = kv.get(src)
             if not isinstance(v, str) or not v:
                 continue
             if (dst in webpipe_env) and (not overwrite):
                 continue
             webpipe_env[dst] = v
-            copied.append(dst)
-
-    webpipe["env"] = webpipe_env
-    servers["webpipe"] = webpipe
-    cfg["mcpServers"] = servers
-    return sorted(set(copied))
+            copied.add(dst)
+    return sorted(copied)
 
 
 def maybe_copy_keys_from_mcp_backups(
@@ -245,43 +326,34 @@ def maybe_copy_keys_from_mcp_backups(
     Copy web-relevant API keys from older ~/.cursor/mcp.json backups into the webpipe env.
     Never prints values.
     """
-    servers = cfg.get("mcpServers") or {}
-    if not isinstance(servers, dict):
-        return []
-    webpipe = servers.get("webpipe") or {}
-    if not isinstance(webpipe, dict):
-        return []
-    webpipe_env = webpipe.get("env") or {}
-    if not isinstance(webpipe_env, dict):
+    webpipe_env = _webpipe_env(cfg)
+    if webpipe_env is None:
         return []
 
-    # Source key -> destination key in webpipe env
-    mapping = {
-        "TAVILY_API_KEY": "WEBPIPE_TAVILY_API_KEY",
-        "FIRECRAWL_API_KEY": "WEBPIPE_FIRECRAWL_API_KEY",
-        "BRAVE_SEARCH_API_KEY": "WEBPIPE_BRAVE_API_KEY",
-        "WEBPIPE_TAVILY_API_KEY": "WEBPIPE_TAVILY_API_KEY",
-        "WEBPIPE_FIRECRAWL_API_KEY": "WEBPIPE_FIRECRAWL_API_KEY",
-        "WEBPIPE_BRAVE_API_KEY": "WEBPIPE_BRAVE_API_KEY",
-    }
-
-    copied: list[str] = []
+    copied: set[str] = set()
 
     def try_copy_from_env(env: dict[str, Any]) -> None:
         nonlocal copied
-        for src, dst in mapping.items():
+        if not overwrite and _TARGET_KEYS.issubset(webpipe_env.keys()):
+            return
+        for src, dst in _KEY_SOURCES:
             v = env.get(src)
             if not isinstance(v, str) or not v:
                 continue
             if (dst in webpipe_env) and (not overwrite):
                 continue
             webpipe_env[dst] = v
-            copied.append(dst)
+            copied.add(dst)
+
+    # Nothing to fill in (and nothing to overwrite): don't read any backup.
+    done = (not overwrite) and _TARGET_KEYS.issubset(webpipe_env.keys())
 
     # Search backups newest-first (caller should pass in that order).
     for p in backup_paths:
+        if done:
+            break
         try:
-            data = json.loads(p.read_text(encoding="utf-8"))
+            data = _json_loads(p.read_bytes())
         except Exception:
             continue
         bservers = data.get("mcpServers") or {}
@@ -301,15 +373,9 @@ def maybe_copy_keys_from_mcp_backups(
             if isinstance(env, dict):
                 try_copy_from_env(env)
 
-        # If we found everything we want, stop early.
-        need = {"WEBPIPE_TAVILY_API_KEY", "WEBPIPE_FIRECRAWL_API_KEY", "WEBPIPE_BRAVE_API_KEY"}
-        if need.issubset(set(webpipe_env.keys())):
-            break
-
-    webpipe["env"] = webpipe_env
-    servers["webpipe"] = webpipe
-    cfg["mcpServers"] = servers
-    return sorted(set(copied))
+        # If we found everything we want, stop before reading the next (older) backup.
+        done = _TARGET_KEYS.issubset(webpipe_env.keys())
+    return sorted(copied)
 
 
 def prune_servers(
@@ -322,15 +388,15 @@ def prune_servers(
     if not isinstance(servers, dict):
         return []
 
-    removed: list[str] = []
+    removed: set[str] = set()
 
     if only_webpipe:
         for name in list(servers.keys()):
             if name != "webpipe":
                 servers.pop(name, None)
-                removed.append(name)
+                removed.add(name)
         cfg["mcpServers"] = servers
-        return sorted(set(removed))
+        return sorted(removed)
 
     if prune_legacy:
         legacy = [
@@ -341,10 +407,10 @@ def prune_servers(
         for name in legacy:
             if name in servers:
                 servers.pop(name, None)
-                removed.append(name)
+                removed.add(name)
 
     cfg["mcpServers"] = servers
-    return sorted(set(removed))
+    return sorted(removed)
 
 
 def main() -> None:
@@ -433,8 +499,14 @@ def main() -> None:
             backups = explicit
         else:
             # Auto-discover in ~/.cursor (newest-first by filename timestamp in suffix).
-            cur = Path.home() / ".cursor"
-            backups = sorted(cur.glob("mcp.json.bak-*"), reverse=True)
+            # One directory read; names sort the same as the Paths glob() returned.
+            cur = paths.mcp_json.parent  # ~/.cursor, as found by default_paths()
+            try:
+                with os.scandir(cur) as it:
+                    names = [e.name for e in it if e.name.startswith("mcp.json.bak-")]
+            except OSError:
+                names = []
+            backups = [cur / n for n in sorted(names, reverse=True)]
         copied_from_backups = maybe_copy_keys_from_mcp_backups(
             cfg,
             backup_paths=backups,
@@ -454,16 +526,16 @@ def main() -> None:
                 "(build it with: cargo build --release --manifest-path webpipe/crates/webpipe-mcp/Cargo.toml)"
             )
         if copied:
-            print(f"DRY RUN: would copy keys into webpipe env: {', '.join(sorted(set(copied)))}")
+            print(f"DRY RUN: would copy keys into webpipe env: {', '.join(copied)}")
         if copied_from_env:
             print(
                 "DRY RUN: would copy keys from repo .env files into webpipe env: "
-                + ", ".join(sorted(set(copied_from_env)))
+                + ", ".join(copied_from_env)
             )
         if copied_from_backups:
             print(
                 "DRY RUN: would copy keys from mcp.json backups into webpipe env: "
-                + ", ".join(sorted(set(copied_from_backups)))
+                + ", ".join(copied_from_backups)
             )
         if removed:
             print(f"DRY RUN: would remove MCP servers: {', '.join(removed)}")
@@ -481,16 +553,16 @@ def main() -> None:
             "Build it with: cargo build --release --manifest-path webpipe/crates/webpipe-mcp/Cargo.toml"
         )
     if copied:
-        print(f"Copied keys into webpipe env: {', '.join(sorted(set(copied)))}")
+        print(f"Copied keys into webpipe env: {', '.join(copied)}")
     if copied_from_env:
         print(
             "Copied keys from repo .env files into webpipe env: "
-            + ", ".join(sorted(set(copied_from_env)))
+            + ", ".join(copied_from_env)
         )
     if copied_from_backups:
         print(
             "Copied keys from mcp.json backups into webpipe env: "
-            + ", ".join(sorted(set(copied_from_backups)))
+            + ", ".join(copied_from_backups)
         )
     if removed:
         print(f"Removed MCP servers: {', '.join(removed)}")
@@ -9,13 +9,23 @@ Policy (current):
 
 from __future__ import annotations
 
+import os
 import pathlib
 import sys
 import tomllib
+from concurrent.futures import ThreadPoolExecutor
+
+try:  # Optional: rtoml (Rust-backed) parses faster; stdlib tomllib is the fallback.
+    import rtoml
+except ImportError:  # pragma: no cover
+    rtoml = None  # type: ignore[assignment]
 
 
 def load_toml(path: pathlib.Path) -> dict:
-    return tomllib.loads(path.read_text(encoding="utf-8"))
+    text = path.read_text(encoding="utf-8")
+    if rtoml is not None:
+        return rtoml.loads(text)
+    return tomllib.loads(text)
 
 
 def package_name_and_publish_flag(cargo_toml: pathlib.Path) -> tuple[str | None, object]:
@@ -34,9 +44,13 @@ def main() -> int:
 
     errors: list[str] = []
 
-    for m in members:
-        cargo_toml = (repo_root / m / "Cargo.toml").resolve()
-        name, publish = package_name_and_publish_flag(cargo_toml)
+    # Manifest reads are independent: overlap them in threads, then check in member order.
+    cargo_tomls = [(repo_root / m / "Cargo.toml").resolve() for m in members]
+    workers = min(32, (os.cpu_count() or 1) * 4, len(cargo_tomls))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        results = list(ex.map(package_name_and_publish_flag, cargo_tomls))
+
+    for cargo_toml, (name, publish) in zip(cargo_tomls, results):
         if name is None:
             errors.append(f"{cargo_toml}: missing [package].name")
             continue